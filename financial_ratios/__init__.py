@@ -11,19 +11,25 @@ This module provides implementations of various financial ratios categorized int
 It also provides utilities to identify which financial data fields are required for each ratio calculation.
 """
 
-from .ratios_controller import Ratios
-from . import (
-    earnings_model,
-    financial_health_model,
-    quality_model,
-    valuation_model,
-)
+import importlib
+
 from .utils import financial_dependencies, FinancialDependencyRegistry
 
+# The ratio modules and the controller are imported on first access (PEP 562), so that
+# importing the package, e.g. only for the dependency registry, does not load them all.
+_SUBMODULES = {
+    'earnings_model',
+    'financial_health_model',
+    'quality_model',
+    'valuation_model',
+}
+_CONTROLLER_ATTRIBUTES = {'Ratios', 'collect_ratios_by_ticker'}
+
 __version__ = "0.1.0"
 
 __all__ = [
     'Ratios',
+    'collect_ratios_by_ticker',
     'earnings_model',
     'financial_health_model',
     'quality_model',
@@ -31,3 +37,19 @@ __all__ = [
     'financial_dependencies',
     'FinancialDependencyRegistry'
 ]
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    elif name in _CONTROLLER_ATTRIBUTES:
+        value = getattr(importlib.import_module('.ratios_controller', __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,18 @@
+import inspect
+from functools import wraps
+from typing import Union
+
 import pandas as pd
 import numpy as np
-from typing import Union
 
-from financial_ratios.utils.helpers import calculate_growth, calculate_average
+from financial_ratios.utils.helpers import (
+    calculate_growth,
+    calculate_average,
+    calculate_rolling_count,
+    mask_infinite,
+    safe_divide,
+    safe_divide_by,
+)
 
 """
 Financial Ratio Analysis Module
@@ -10,8 +20,9 @@ Financial Ratio Analysis Module
 This module contains functions for calculating various financial ratios and metrics
 organized into the following categories:
 
-1. Composite Scores (1 function)
+1. Composite Scores (2 functions)
    - get_piotroski_score
+   - get_piotroski_score_batch
 
 2. Basic Growth Metrics (2 functions)
    - get_revenue_growth
@@ -51,16 +62,44 @@ organized into the following categories:
    - get_free_cash_flow_growth
    - get_free_cash_flow_average_growth
 
-Total Functions: 23
+Total Functions: 24
 
 Note: All functions handle invalid calculations (like division by zero) by returning NaN
 values for those specific time periods, maintaining the time series structure.
+
+The functions keep the floating point precision of their inputs. Passing float32 series
+halves the memory moved by the growth and rolling calculations, at the cost of roughly
+seven significant digits, which is ample for ratios rounded to four decimals.
 """
 
+
+def _nan_on_failure(func):
+    """
+    Return a NaN series on the index of the first argument if the calculation fails.
+
+    Keeps the ratio functions free of their own try/except blocks while preserving the
+    time series structure for callers when an input is malformed.
+    """
+    first_parameter = next(iter(inspect.signature(func).parameters))
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            series = args[0] if args else kwargs.get(first_parameter)
+            if not hasattr(series, 'index'):
+                raise
+            return pd.Series(np.nan, index=series.index)
+
+    return wrapper
+
+
 # ----------------------
 # 1. Composite Scores
 # ----------------------
 
+@_nan_on_failure
 def get_piotroski_score(
         net_income: pd.Series,
         total_assets: pd.Series,
@@ -77,63 +116,167 @@ def get_piotroski_score(
 
     Returns a score between 0 and 9 per time index.
     """
-    try:
-        score = pd.Series(0, index=net_income.index)
+    index = net_income.index
+
+    # Extract every input once as a float64 array aligned to net income
+    ni = _values_on_index(net_income, index)
+    ta = _values_on_index(total_assets, index)
+    cfo = _values_on_index(cash_flow_from_operations, index)
+    ca = _values_on_index(current_assets, index)
+    cl = _values_on_index(current_liabilities, index)
+    ltd = _values_on_index(long_term_debt, index)
+    rev = _values_on_index(revenue, index)
+    cogs_values = _values_on_index(cogs, index)
+
+    # Shares are compared against their own previous period before aligning
+    shares_change = _yoy_change(shares_outstanding.to_numpy(dtype=np.float64, na_value=np.nan))
+    if not shares_outstanding.index.equals(index):
+        shares_change = _values_on_index(pd.Series(shares_change, index=shares_outstanding.index), index)
+
+    score = _piotroski_criteria(ni, ta, cfo, ca, cl, ltd, shares_change, rev, cogs_values)
+    # Scores are missing where net income or total assets are
+    result = pd.arrays.IntegerArray(score.astype(np.int64), np.isnan(ni) | np.isnan(ta))
+
+    return pd.Series(result, index=index)
+
+
+def get_piotroski_score_batch(data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Calculate the Piotroski F-Score for many tickers at once.
+
+    Equivalent to calling get_piotroski_score for every column, but the nine criteria
+    are evaluated once on 2-D arrays instead of once per ticker.
+
+    Parameters
+    ----------
+    data : dict[str, pd.DataFrame]
+        Inputs keyed by the parameter names of get_piotroski_score, each shaped
+        (periods x tickers). Every input is aligned to the net_income frame.
+
+    Returns
+    -------
+    pd.DataFrame
+        Int64 scores between 0 and 9 per period and ticker, NA where net income
+        or total assets are missing
+    """
+    net_income = data['net_income']
+    index, columns = net_income.index, net_income.columns
+
+    def values(frame: pd.DataFrame) -> np.ndarray:
+        if not (frame.index.equals(index) and frame.columns.equals(columns)):
+            frame = frame.reindex(index=index, columns=columns)
+        return frame.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    ni = values(net_income)
+    ta = values(data['total_assets'])
+
+    # Shares are compared against their own previous period before aligning
+    shares = data['shares_outstanding']
+    shares_change = values(pd.DataFrame(
+        _yoy_change(shares.to_numpy(dtype=np.float64, na_value=np.nan)),
+        index=shares.index,
+        columns=shares.columns,
+    ))
+
+    score = _piotroski_criteria(
+        ni,
+        ta,
+        values(data['cash_flow_from_operations']),
+        values(data['current_assets']),
+        values(data['current_liabilities']),
+        values(data['long_term_debt']),
+        shares_change,
+        values(data['revenue']),
+        values(data['cogs']),
+    )
+
+    # Build each ticker's Int64 column from its scores and missing-input mask in one step
+    scores = score.T.astype(np.int64)
+    missing = (np.isnan(ni) | np.isnan(ta)).T
+
+    result = pd.DataFrame(
+        {i: pd.arrays.IntegerArray(scores[i], missing[i]) for i in range(len(columns))},
+        index=index,
+    )
+    result.columns = columns
+
+    return result
+
+
+def _piotroski_criteria(
+        ni: np.ndarray,
+        ta: np.ndarray,
+        cfo: np.ndarray,
+        ca: np.ndarray,
+        cl: np.ndarray,
+        ltd: np.ndarray,
+        shares_change: np.ndarray,
+        rev: np.ndarray,
+        cogs: np.ndarray
+) -> np.ndarray:
+    """Count the criteria met per period, capped at 9. Periods run along the first axis."""
+    score = np.zeros(ni.shape, dtype=np.uint8)
 
-        # 1. Positive Net Income
-        score += (net_income > 0).astype(int)
+    # 1. Positive Net Income
+    score += (ni > 0).view(np.uint8)
 
-        # 2. Positive ROA (Return on Assets)
-        roa = net_income / total_assets.replace(0, np.nan)
-        score += (roa > 0).astype(int)
+    # Total assets is the denominator of three ratios, so validate it only once
+    per_assets = safe_divide_by(ta)
 
-        # 3. Positive Operating Cash Flow
-        score += (cash_flow_from_operations > 0).astype(int)
+    # 2. Positive ROA (Return on Assets)
+    roa = per_assets(ni)
+    score += (roa > 0).view(np.uint8)
 
-        # 4. CFO > Net Income
-        score += ((cash_flow_from_operations > net_income)).astype(int)
+    # 3. Positive Operating Cash Flow
+    score += (cfo > 0).view(np.uint8)
 
-        # 5. ROA Improvement YoY
-        roa_change = roa - roa.shift(1)
-        score += (roa_change > 0).astype(int)
+    # 4. CFO > Net Income
+    score += (cfo > ni).view(np.uint8)
 
-        # 6. Decrease in Leverage (Long-Term Debt / Total Assets)
-        debt_ratio = long_term_debt / total_assets.replace(0, np.nan)
-        debt_change = debt_ratio - debt_ratio.shift(1)
-        score += (debt_change < 0).astype(int)
+    # 5. ROA Improvement YoY
+    score += (_yoy_change(roa) > 0).view(np.uint8)
 
-        # 7. Improvement in Current Ratio
-        current_ratio = current_assets / current_liabilities.replace(0, np.nan)
-        current_ratio_change = current_ratio - current_ratio.shift(1)
-        score += (current_ratio_change > 0).astype(int)
+    # 6. Decrease in Leverage (Long-Term Debt / Total Assets)
+    score += (_yoy_change(per_assets(ltd)) < 0).view(np.uint8)
 
-        # 8. No Dilution (no increase in shares outstanding)
-        shares_change = shares_outstanding - shares_outstanding.shift(1)
-        score += (shares_change <= 0).astype(int)
+    # 7. Improvement in Current Ratio
+    score += (_yoy_change(safe_divide(ca, cl)) > 0).view(np.uint8)
 
-        # 9. Improvement in Gross Margin
-        gross_margin = (revenue - cogs) / revenue.replace(0, np.nan)
-        gross_margin_change = gross_margin - gross_margin.shift(1)
-        score += (gross_margin_change > 0).astype(int)
+    # 8. No Dilution (no increase in shares outstanding)
+    score += (shares_change <= 0).view(np.uint8)
 
-        # 10. Improvement in Asset Turnover
-        asset_turnover = revenue / total_assets.replace(0, np.nan)
-        asset_turnover_change = asset_turnover - asset_turnover.shift(1)
-        score += (asset_turnover_change > 0).astype(int)
+    # 9. Improvement in Gross Margin
+    score += (_yoy_change(safe_divide(rev - cogs, rev)) > 0).view(np.uint8)
 
-        # Cap score at 9 and handle NaNs where key inputs are missing
-        score = score.where(~pd.isna(net_income) & ~pd.isna(total_assets), np.nan)
-        score = score.clip(upper=9).astype('Int64')
+    # 10. Improvement in Asset Turnover
+    score += (_yoy_change(per_assets(rev)) > 0).view(np.uint8)
 
-        return score
+    np.minimum(score, 9, out=score)
+    return score
 
-    except Exception:
-        return pd.Series(np.nan, index=net_income.index)
+
+def _values_on_index(series: pd.Series, index: pd.Index) -> np.ndarray:
+    """
+    Return the values of a series as a float64 array reindexed to the given index.
+
+    Unlike helpers.aligned_values, which aligns on the union of the input indexes and keeps
+    numeric dtypes, this follows one fixed index (net income's for the F-Score) and always
+    returns float64.
+    """
+    if not series.index.equals(index):
+        series = series.reindex(index)
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _yoy_change(values: np.ndarray) -> np.ndarray:
+    """Difference between each period and the previous one, NaN for the first period."""
+    return np.diff(values, axis=0, prepend=np.nan)
 
 # ------------------------
 # 2. Basic Growth Metrics
 # ------------------------
 
+@_nan_on_failure
 def get_revenue_growth(revenue: pd.Series) -> pd.Series:
     """
     Calculate the period-over-period revenue growth rate.
@@ -148,22 +291,16 @@ def get_revenue_growth(revenue: pd.Series) -> pd.Series:
     pd.Series
         Time series of revenue growth rates
     """
-    try:
-        # Handle missing values
-        if revenue is None or revenue.empty:
-            return pd.Series(dtype=float)
-        growth = calculate_growth(revenue)
-
-        # Handle invalid calculations
-        growth = growth.replace([np.inf, -np.inf], np.nan)
+    # Handle missing values
+    if revenue is None or revenue.empty:
+        return pd.Series(dtype=float)
+    growth = calculate_growth(revenue)
 
-        return growth
-
-    except Exception as e:
-        # Return NaN series in case of any error
-        return pd.Series(np.nan, index=revenue.index)
+    # Handle invalid calculations
+    return mask_infinite(growth)
 
 
+@_nan_on_failure
 def get_eps_growth(eps: pd.Series) -> pd.Series:
     """
     Calculate the period-over-period EPS growth rate.
@@ -179,22 +316,18 @@ def get_eps_growth(eps: pd.Series) -> pd.Series:
         Time series of EPS growth rates. Returns NaN for periods with insufficient data,
         zero EPS values in denominator, or other invalid calculations.
     """
-    try:
-        if eps is None or eps.empty:
-            return pd.Series(dtype=float)
-        eps = eps.replace([np.inf, -np.inf], np.nan)
-
-        growth = calculate_growth(eps)
+    if eps is None or eps.empty:
+        return pd.Series(dtype=float)
+    # Infinite EPS values can only produce infinite or NaN growth, both masked below
+    growth = calculate_growth(eps)
 
-        return growth.replace([np.inf, -np.inf], np.nan)
-
-    except Exception as e:
-        return pd.Series(np.nan, index=eps.index)
+    return mask_infinite(growth)
 
 # --------------------------------
 # 3. Consecutive Growth Analysis
 # --------------------------------
 
+@_nan_on_failure
 def get_revenue_consecutive_growth(revenue: pd.Series) -> pd.Series:
     """
     Calculate the number of consecutive periods of revenue growth.
@@ -209,17 +342,11 @@ def get_revenue_consecutive_growth(revenue: pd.Series) -> pd.Series:
     pd.Series
         Time series of consecutive growth periods
     """
-    try:
-        growth = calculate_growth(revenue)
-        growth.replace([np.inf, -np.inf], np.nan)
-        result = (growth > 0).rolling(window=20, min_periods=1).sum()
-        return result
-
-    except Exception as e:
-        # Return NaN series in case of any error
-        return pd.Series(np.nan, index=revenue.index)
+    growth = calculate_growth(revenue)
+    return calculate_rolling_count(growth > 0, window=20)
 
 
+@_nan_on_failure
 def get_eps_consecutive_growth(eps: pd.Series) -> pd.Series:
     """
     Calculate the number of consecutive periods of EPS growth.
@@ -234,20 +361,14 @@ def get_eps_consecutive_growth(eps: pd.Series) -> pd.Series:
     pd.Series
         Time series of consecutive growth periods
     """
-    try:
-        growth = calculate_growth(eps)
-        growth.replace([0, np.inf, -np.inf], np.nan)
-        result = (growth > 0).rolling(window=20, min_periods=1).sum()
-        return result
-
-    except Exception as e:
-        # Return NaN series in case of any error
-        return pd.Series(np.nan, index=eps.index)
+    growth = calculate_growth(eps)
+    return calculate_rolling_count(growth > 0, window=20)
 
 # ---------------------------
 # 4. Average Growth Analysis
 # ---------------------------
 
+@_nan_on_failure
 def get_average_revenue_growth(revenue: pd.Series) -> pd.Series:
     """
     Calculate the 20-period trailing average revenue growth rate.
@@ -262,24 +383,20 @@ def get_average_revenue_growth(revenue: pd.Series) -> pd.Series:
     pd.Series
         Time series of average revenue growth rates
     """
-    try:
-        # Handle missing values
-        if revenue is None or revenue.empty:
-            return pd.Series(dtype=float)
+    # Handle missing values
+    if revenue is None or revenue.empty:
+        return pd.Series(dtype=float)
 
-        # Calculate rolling average with more lenient min_periods
-        avg_growth = calculate_average(revenue, growth=True, trailing=20)
+    # Calculate rolling average with more lenient min_periods
+    avg_growth = calculate_average(revenue, growth=True, trailing=20)
 
-        # Handle invalid calculations
-        avg_growth = avg_growth.replace([0, np.inf, -np.inf], np.nan)
+    # Handle invalid calculations
+    avg_growth = mask_infinite(avg_growth, zero=True)
 
-        return avg_growth
-
-    except Exception as e:
-        # Return NaN series in case of any error
-        return pd.Series(np.nan, index=revenue.index)
+    return avg_growth
 
 
+@_nan_on_failure
 def get_average_gross_margin(gross_margin: pd.Series) -> pd.Series:
     """
     Calculate the 20-period trailing average gross margin.
@@ -294,24 +411,20 @@ def get_average_gross_margin(gross_margin: pd.Series) -> pd.Series:
     pd.Series
         Time series of average gross margin values
     """
-    try:
-        # Handle missing values
-        if gross_margin is None or gross_margin.empty:
-            return pd.Series(dtype=float)
-
-        # Calculate rolling average
-        avg_margin = calculate_average(gross_margin, trailing=20, min_periods=1)
+    # Handle missing values
+    if gross_margin is None or gross_margin.empty:
+        return pd.Series(dtype=float)
 
+    # Calculate rolling average
+    avg_margin = calculate_average(gross_margin, trailing=20, min_periods=1)
 
-        # Handle invalid calculations
-        avg_margin = avg_margin.replace([np.inf, -np.inf], np.nan)
 
-        return avg_margin
+    # Handle invalid calculations
+    avg_margin = mask_infinite(avg_margin)
 
-    except Exception as e:
-        # Return NaN series in case of any error
-        return pd.Series(np.nan, index=gross_margin.index)
+    return avg_margin
 
+@_nan_on_failure
 def get_average_gross_margin_growth(gross_margin: pd.Series) -> pd.Series:
     """
     Calculate the 20-period trailing average gross margin growth rate.
@@ -323,16 +436,19 @@ def get_average_gross_margin_growth(gross_margin: pd.Series) -> pd.Series:
         pd.Series: Time series of average gross margin growth rates. Returns NaN for
                   periods with insufficient data or zero gross margin values.
     """
-    try:
-        # Handle zero gross margin values
-        safe_gross_margin = gross_margin.replace(0, np.nan)
+    # Handle zero gross margin values
+    safe_gross_margin = gross_margin.replace(0, np.nan)
 
-        return calculate_average(safe_gross_margin, growth=True, trailing=20, min_periods=1)
-    except Exception as e:
-        return pd.Series(np.nan, index=gross_margin.index)
+    return calculate_average(safe_gross_margin, growth=True, trailing=20, min_periods=1)
 
 
-def get_average_ebitda_margin(ebitda: pd.Series, revenue: pd.Series) -> pd.Series:
+@_nan_on_failure
+def get_average_ebitda_margin(
+        ebitda: pd.Series,
+        revenue: pd.Series,
+        *,
+        ebitda_margin: pd.Series | None = None
+) -> pd.Series:
     """
     Calculate the 20-period trailing average EBITDA.
 
@@ -340,6 +456,10 @@ def get_average_ebitda_margin(ebitda: pd.Series, revenue: pd.Series) -> pd.Serie
     ----------
     ebitda : pd.Series
         Time series of EBITDA values
+    revenue : pd.Series
+        Time series of revenue values
+    ebitda_margin : pd.Series, optional
+        Already calculated EBITDA margin, used instead of dividing EBITDA by revenue
 
     Returns
     -------
@@ -347,14 +467,12 @@ def get_average_ebitda_margin(ebitda: pd.Series, revenue: pd.Series) -> pd.Serie
         Time series of average EBITDA values. Returns NaN for periods with 
         insufficient data or invalid calculations.
     """
-    try:
-        ebitda_margin = ebitda / revenue.replace(0, np.nan)
+    if ebitda_margin is None:
+        ebitda_margin = safe_divide(ebitda, revenue)
 
-        return calculate_average(ebitda_margin, trailing=20)
-        
-    except Exception as e:
-        return pd.Series(np.nan, index=ebitda.index)
+    return calculate_average(ebitda_margin, trailing=20)
 
+@_nan_on_failure
 def get_average_ebitda_margin_growth(ebitda: pd.Series, revenue = pd.Series) -> pd.Series:
     """
     Calculate the 20-period trailing average EBITDA growth rate.
@@ -370,13 +488,11 @@ def get_average_ebitda_margin_growth(ebitda: pd.Series, revenue = pd.Series) ->
         Time series of average EBITDA growth rates. Returns NaN for periods with
         insufficient data or invalid calculations.
     """
-    try:
-        ebitda_margin = ebitda / revenue.replace([0, np.inf, -np.inf], np.nan)
-        return calculate_average(ebitda_margin, growth=True, trailing=20)
-        
-    except Exception as e:
-        return pd.Series(np.nan, index=ebitda.index)
+    # Infinite revenue gives NaN rather than a zero margin
+    ebitda_margin = safe_divide(ebitda, mask_infinite(revenue))
+    return calculate_average(ebitda_margin, growth=True, trailing=20)
 
+@_nan_on_failure
 def get_average_eps_growth(eps: pd.Series) -> pd.Series:
     """
     Calculate the 20-period trailing average EPS growth rate.
@@ -392,20 +508,30 @@ def get_average_eps_growth(eps: pd.Series) -> pd.Series:
         Time series of average EPS growth rates. Returns NaN for periods with
         insufficient data or invalid calculations.
     """
-    try:
-        if eps is None or eps.empty:
-            return pd.Series(dtype=float)
+    if eps is None or eps.empty:
+        return pd.Series(dtype=float)
 
-        return calculate_average(eps, growth=True, trailing=20)
-        
-    except Exception as e:
-        return pd.Series(np.nan, index=eps.index)
+    return calculate_average(eps, growth=True, trailing=20)
 
 
 # ------------------------------
 # 5. Growth Comparison Metrics
 # ------------------------------
 
+def _relative_to_average(values: pd.Series, average: pd.Series | None = None) -> pd.Series:
+    """
+    Relative deviation of each value from its trailing average, (value - average) / average.
+
+    The 20-period trailing average is computed from the given values unless it is passed in,
+    so every comparison metric derives its average from the series it already calculated.
+    """
+    if average is None:
+        average = calculate_average(values, trailing=20)
+
+    return safe_divide(values - average, average)
+
+
+@_nan_on_failure
 def get_revenue_growth_vs_average_growth(revenue: pd.Series) -> pd.Series:
     """
     Calculate the ratio of current revenue growth to its 20-period trailing average growth.
@@ -420,27 +546,23 @@ def get_revenue_growth_vs_average_growth(revenue: pd.Series) -> pd.Series:
     pd.Series
         Time series of growth ratios
     """
-    try:
-        # Handle missing values
-        if revenue is None or revenue.empty:
-            return pd.Series(dtype=float)
+    # Handle missing values
+    if revenue is None or revenue.empty:
+        return pd.Series(dtype=float)
 
-        # Calculate current growth and average growth
-        current_growth = get_revenue_growth(revenue)
-        avg_growth = get_average_revenue_growth(revenue)
+    # Calculate current growth once and derive the average growth from it
+    current_growth = get_revenue_growth(revenue)
+    avg_growth = calculate_average(current_growth, trailing=20)
 
-        # Calculate ratio, handling negative averages
-        ratio = (current_growth - avg_growth) / avg_growth.replace([0, np.inf, -np.inf], np.nan)
+    # Calculate ratio, zero and infinite averages are masked by the division
+    ratio = _relative_to_average(current_growth, avg_growth)
 
-        # Handle invalid calculations and cap extreme values
-        ratio = ratio.replace([0, np.inf, -np.inf], np.nan)
+    # Handle invalid calculations and cap extreme values
+    ratio = mask_infinite(ratio, zero=True)
 
-        return ratio
-
-    except Exception as e:
-        # Return NaN series in case of any error
-        return pd.Series(np.nan, index=revenue.index)
+    return ratio
 
+@_nan_on_failure
 def get_eps_growth_vs_average_growth(eps: pd.Series) -> pd.Series:
     """
     Calculate the ratio of current EPS growth to its 20-period trailing average growth.
@@ -452,17 +574,13 @@ def get_eps_growth_vs_average_growth(eps: pd.Series) -> pd.Series:
     Returns:
         pd.Series: Time series of growth ratios (current growth / average growth)
     """
-    try:
-        # Handle zero EPS values
-        safe_eps = eps.replace(0, np.nan)
-        growth_rates = calculate_growth(safe_eps, lag=1)
-        average_growth_rates = calculate_average(growth_rates, trailing=20)
-        return (growth_rates - average_growth_rates) / average_growth_rates.replace(0, np.nan)
-    except Exception as e:
-        print("Error in Earnings Model: get_eps_growth_vs_average_growth", e)
-        return pd.Series(np.nan, index=eps.index)
+    # Handle zero EPS values
+    safe_eps = eps.replace(0, np.nan)
+    growth_rates = calculate_growth(safe_eps, lag=1)
+    return _relative_to_average(growth_rates)
 
 
+@_nan_on_failure
 def get_ebitda_margin_vs_average(ebitda: pd.Series, revenue: pd.Series) -> pd.Series:
     """
     Calculate the ratio of current EBITDA growth to its 20-period trailing average growth.
@@ -479,19 +597,15 @@ def get_ebitda_margin_vs_average(ebitda: pd.Series, revenue: pd.Series) -> pd.Se
         periods with insufficient data or invalid calculations.
     """
 
-    try:
-        if ebitda is None or ebitda.empty:
-            return pd.Series(dtype=float)
-        ebitda_margin = ebitda / revenue.replace(0, np.nan)
+    if ebitda is None or ebitda.empty:
+        return pd.Series(dtype=float)
+    ebitda_margin = safe_divide(ebitda, revenue)
 
-        average = get_average_ebitda_margin(ebitda, revenue)
+    average = get_average_ebitda_margin(ebitda, revenue, ebitda_margin=ebitda_margin)
 
-        return (ebitda_margin - average) / average.replace(0, np.nan)
-        
-    except Exception as e:
-        print("Error in Earnings Model: get_ebitda_growth_vs_average_growth", e)
-        return pd.Series(np.nan, index=ebitda.index)
+    return _relative_to_average(ebitda_margin, average)
 
+@_nan_on_failure
 def get_gross_margin_vs_average(gross_profit: pd.Series, revenue: pd.Series) -> pd.Series:
     """
     Calculate the ratio of current gross margin growth to its 20-period trailing average growth.
@@ -508,23 +622,20 @@ def get_gross_margin_vs_average(gross_profit: pd.Series, revenue: pd.Series) ->
         periods with insufficient data or invalid calculations.
     """
 
-    try:
-        if gross_profit is None or gross_profit.empty:
-            return pd.Series(dtype=float)
+    if gross_profit is None or gross_profit.empty:
+        return pd.Series(dtype=float)
 
-        gross_margin = gross_profit / revenue.replace(0, np.nan)
+    gross_margin = safe_divide(gross_profit, revenue)
 
-        avg_gross_margin = get_average_gross_margin(gross_margin)
-        return (gross_margin - avg_gross_margin) / avg_gross_margin.replace(0, np.nan)
-        
-    except Exception as e:
-        return pd.Series(np.nan, index=gross_profit.index)
+    avg_gross_margin = get_average_gross_margin(gross_margin)
+    return _relative_to_average(gross_margin, avg_gross_margin)
 
 
 # ------------------
 # 6. Return Metrics
 # ------------------
 
+@_nan_on_failure
 def get_return_on_equity(net_income: pd.Series, shareholders_equity: pd.Series) -> pd.Series:
     """
     Calculate Return on Equity (ROE).
@@ -541,24 +652,20 @@ def get_return_on_equity(net_income: pd.Series, shareholders_equity: pd.Series)
     pd.Series
         Time series of ROE values
     """
-    try:
-        # Handle missing values
-        if net_income is None or shareholders_equity is None:
-            return pd.Series(dtype=float)
-
-        # Calculate ROE
-        roe = net_income / shareholders_equity.replace([0, np.inf, -np.inf], np.nan)
+    # Handle missing values
+    if net_income is None or shareholders_equity is None:
+        return pd.Series(dtype=float)
 
-        # Handle invalid calculations
-        roe = roe.replace([0, np.inf, -np.inf], np.nan)
+    # Calculate ROE
+    roe = safe_divide(net_income, shareholders_equity)
 
-        return roe
+    # Handle invalid calculations
+    roe = mask_infinite(roe, zero=True)
 
-    except Exception as e:
-        # Return NaN series in case of any error
-        return pd.Series(np.nan, index=net_income.index)
+    return roe
 
 
+@_nan_on_failure
 def get_roe_vs_average_roe(net_income: pd.Series, shareholders_equity: pd.Series) -> pd.Series:
     """
     Calculate the ratio of current Return on Equity (ROE) to its 20-period trailing average.
@@ -576,17 +683,13 @@ def get_roe_vs_average_roe(net_income: pd.Series, shareholders_equity: pd.Series
         Time series of ROE ratios (current ROE / average ROE). Returns NaN for
         periods with insufficient data or invalid calculations.
     """
-    try:
-        if net_income is None or shareholders_equity is None or net_income.empty or shareholders_equity.empty:
-            return pd.Series(dtype=float)
-            
-        current_roe = get_return_on_equity(net_income, shareholders_equity)
-        avg_roe = calculate_average(current_roe, trailing=20)
-        return (current_roe-avg_roe) / avg_roe.replace(0, np.nan)
+    if net_income is None or shareholders_equity is None or net_income.empty or shareholders_equity.empty:
+        return pd.Series(dtype=float)
         
-    except Exception as e:
-        return pd.Series(np.nan, index=net_income.index)
+    current_roe = get_return_on_equity(net_income, shareholders_equity)
+    return _relative_to_average(current_roe)
 
+@_nan_on_failure
 def get_return_on_assets(net_income: pd.Series, assets: pd.Series) -> pd.Series:
     """
     Calculate Return on Assets (ROA), which measures how efficiently a company uses
@@ -599,33 +702,23 @@ def get_return_on_assets(net_income: pd.Series, assets: pd.Series) -> pd.Series:
     Returns:
         pd.Series: Time series of ROA values
     """
-    try:
-        # Handle zero assets values
-        safe_assets = assets.replace(0, np.nan)
-        return net_income / safe_assets
-    except Exception as e:
-        print("Error in Earnings Model: get_return_on_assets", e)
-        return pd.Series(np.nan, index=net_income.index)
+    return safe_divide(net_income, assets)
 
 
+@_nan_on_failure
 def get_roa_vs_average_roa(net_income: pd.Series, assets: pd.Series) -> pd.Series:
     """Calculate the ratio of current ROA to its average."""
-    try:
-        if net_income is None or assets is None:
-            return pd.Series(dtype=float)
-
-        current_roa = net_income / assets.replace(0, np.nan)
-        avg_roa = calculate_average(current_roa, trailing=20)
-        ratio = (current_roa-avg_roa) / avg_roa.replace(0, np.nan)
-        ratio = ratio.replace([np.inf, -np.inf], np.nan)
-        return ratio
-    except Exception as e:
-        return pd.Series(np.nan, index=net_income.index)
+    if net_income is None or assets is None:
+        return pd.Series(dtype=float)
+
+    current_roa = safe_divide(net_income, assets)
+    return mask_infinite(_relative_to_average(current_roa))
 
 # -----------------------------
 # 7. Estimate Comparison Metrics
 # -----------------------------
 
+@_nan_on_failure
 def get_revenue_vs_estimate(revenue: pd.Series, revenue_estimate: pd.Series) -> pd.Series:
     """
     Calculate the ratio of actual revenue to estimated revenue.
@@ -642,24 +735,20 @@ def get_revenue_vs_estimate(revenue: pd.Series, revenue_estimate: pd.Series) ->
     pd.Series
         Time series of revenue ratios
     """
-    try:
-        # Handle missing values
-        if revenue is None or revenue_estimate is None:
-            return pd.Series(dtype=float)
-
-        # Calculate ratio
-        ratio = revenue / revenue_estimate.replace(0, np.nan)
+    # Handle missing values
+    if revenue is None or revenue_estimate is None:
+        return pd.Series(dtype=float)
 
-        # Handle invalid calculations
-        ratio = ratio.replace([np.inf, -np.inf], np.nan)
+    # Calculate ratio
+    ratio = safe_divide(revenue, revenue_estimate)
 
-        return ratio
+    # Handle invalid calculations
+    ratio = mask_infinite(ratio)
 
-    except Exception as e:
-        # Return NaN series in case of any error
-        return pd.Series(np.nan, index=revenue.index)
+    return ratio
 
 
+@_nan_on_failure
 def get_shares_outstanding_vs_estimate(
     net_income: pd.Series,
     eps: pd.Series,
@@ -687,21 +776,18 @@ def get_shares_outstanding_vs_estimate(
         Time series of shares outstanding ratios (actual / estimated). Returns NaN for
         periods with insufficient data, zero values in denominators, or invalid calculations.
     """
-    try:
-        if any(x is None or x.empty for x in [net_income, eps, net_income_estimate, eps_estimate]):
-            return pd.Series(dtype=float)
-            
-        actual_shares = net_income / eps.replace(0, np.nan)
-        estimated_shares = net_income_estimate / eps_estimate.replace(0, np.nan)
-        return actual_shares / estimated_shares.replace(0, np.nan)
+    if any(x is None or x.empty for x in [net_income, eps, net_income_estimate, eps_estimate]):
+        return pd.Series(dtype=float)
         
-    except Exception as e:
-        return pd.Series(np.nan, index=net_income.index)
+    actual_shares = safe_divide(net_income, eps)
+    estimated_shares = safe_divide(net_income_estimate, eps_estimate)
+    return safe_divide(actual_shares, estimated_shares)
 
 # ----------------------
 # 8. Cash Flow Analysis
 # ----------------------
 
+@_nan_on_failure
 def get_free_cash_flow_growth(free_cash_flow: pd.Series) -> pd.Series:
     """
     Calculate the year-over-year free cash flow growth rate.
@@ -716,19 +802,15 @@ def get_free_cash_flow_growth(free_cash_flow: pd.Series) -> pd.Series:
     pd.Series
         Time series of free cash flow growth rates
     """
-    try:
-        # Handle missing values
-        if free_cash_flow is None or free_cash_flow.empty:
-            return pd.Series(dtype=float)
-        growth = calculate_growth(free_cash_flow)
+    # Handle missing values
+    if free_cash_flow is None or free_cash_flow.empty:
+        return pd.Series(dtype=float)
+    growth = calculate_growth(free_cash_flow)
 
-        return growth
-
-    except Exception as e:
-        # Return NaN series in case of any error
-        return pd.Series(np.nan, index=free_cash_flow.index)
+    return growth
 
 
+@_nan_on_failure
 def get_free_cash_flow_average_growth(free_cash_flow: pd.Series) -> pd.Series:
     """
     Calculate the 20-period trailing average free cash flow growth rate.
@@ -744,11 +826,7 @@ def get_free_cash_flow_average_growth(free_cash_flow: pd.Series) -> pd.Series:
         Time series of average free cash flow growth rates. Returns NaN for periods with
         insufficient data or invalid calculations.
     """
-    try:
-        if free_cash_flow is None or free_cash_flow.empty:
-            return pd.Series(dtype=float)
+    if free_cash_flow is None or free_cash_flow.empty:
+        return pd.Series(dtype=float)
 
-        return calculate_average(free_cash_flow, growth=True, trailing=5)
-        
-    except Exception as e:
-        return pd.Series(np.nan, index=free_cash_flow.index)
\ No newline at end of file
+    return calculate_average(free_cash_flow, growth=True, trailing=5)
\ No newline at end of file
@@ -2,6 +2,8 @@ import pandas as pd
 import numpy as np
 from typing import Union
 
+from financial_ratios.utils.helpers import aligned_values, mask_infinite, safe_divide, safe_divide_by
+
 """
 Financial Health Analysis Module
 
@@ -18,13 +20,19 @@ organized into the following categories:
 3. Operational Efficiency (1 function)
    - get_cash_conversion_cycle
 
-4. Bankruptcy Risk (1 function)
+4. Bankruptcy Risk (2 functions)
    - get_altman_z_score
+   - get_altman_z_score_batch
 
-Total Functions: 5
+Total Functions: 6
 
 Note: All functions handle invalid calculations (like division by zero) by returning NaN
 values for those specific time periods, maintaining the time series structure.
+
+The ratio functions also accept (periods x tickers) DataFrames in place of Series to
+calculate a ratio for many tickers at once; get_altman_z_score_batch does the same for
+the Z-Score. Results keep the floating point precision of the inputs, so float32 data
+stays float32 throughout.
 """
 
 # ---------------------
@@ -48,10 +56,8 @@ def get_debt_to_equity_ratio(
         pd.Series: Time series of debt to equity ratio values. Returns NaN for periods
                   where equity is zero or negative.
     """
-    result = total_debt / total_equity
-    # Replace infinite values with NaN (occurs when equity is zero)
-    result = result.replace([np.inf, -np.inf], np.nan)
-    return result
+    # Zero equity gives NaN, as do infinite ratios (e.g. from infinite debt)
+    return mask_infinite(safe_divide(total_debt, total_equity))
 
 def get_interest_coverage_ratio(
         ebit: pd.Series,
@@ -72,10 +78,8 @@ def get_interest_coverage_ratio(
         pd.Series: Time series of interest coverage ratio values. Returns NaN for periods
                   where interest expense is zero.
     """
-    # Handle zero interest expense by replacing with NaN
-    safe_interest = interest_expense.replace(0, np.nan)
-    result = ebit / abs(safe_interest)
-    return result
+    # Zero interest expense gives NaN
+    return safe_divide(ebit, abs(interest_expense))
 
 # ---------------------
 # 2. Liquidity Ratios
@@ -98,9 +102,8 @@ def get_current_ratio(
         pd.Series: Time series of current ratio values. Returns NaN for periods where
                   current liabilities are zero.
     """
-    # Handle zero liabilities by replacing with NaN
-    safe_liabilities = current_liabilities.replace(0, np.nan)
-    return current_assets / safe_liabilities
+    # Zero liabilities give NaN
+    return safe_divide(current_assets, current_liabilities)
 
 # ---------------------------
 # 3. Operational Efficiency
@@ -136,20 +139,36 @@ def get_cash_conversion_cycle(
         pd.Series: Time series of Cash Conversion Cycle values in days. Returns NaN for
                   periods where any denominator (COGS or revenue) is zero.
     """
-    # Handle zero denominators by replacing with NaN
-    safe_cogs = cogs.replace(0, np.nan)
-    safe_revenue = revenue.replace(0, np.nan)
+    series = (inventory, cogs, accounts_receivable, revenue, accounts_payable)
+    if not all(isinstance(item, pd.Series) for item in series):
+        # (periods x tickers) frames keep pandas alignment on both axes
+        days_inventory_outstanding = safe_divide(inventory, cogs) * days
+        days_sales_outstanding = safe_divide(accounts_receivable, revenue) * days
+        days_payables_outstanding = safe_divide(accounts_payable, cogs) * days
+
+        return days_inventory_outstanding + days_sales_outstanding - days_payables_outstanding
+
+    index, (inventory, cogs, accounts_receivable, revenue, accounts_payable) = aligned_values(*series)
 
-    days_inventory_outstanding = (inventory / safe_cogs) * days
-    days_sales_outstanding = (accounts_receivable / safe_revenue) * days
-    days_payables_outstanding = (accounts_payable / safe_cogs) * days
+    # Zero denominators give NaN, COGS is validated once for both of its ratios
+    per_cogs = safe_divide_by(cogs)
+    days_inventory_outstanding = per_cogs(inventory) * days
+    days_sales_outstanding = safe_divide(accounts_receivable, revenue) * days
+    days_payables_outstanding = per_cogs(accounts_payable) * days
 
-    return days_inventory_outstanding + days_sales_outstanding - days_payables_outstanding
+    return pd.Series(
+        days_inventory_outstanding + days_sales_outstanding - days_payables_outstanding,
+        index=index
+    )
 
 # ----------------------
 # 4. Bankruptcy Risk
 # ----------------------
 
+# Weights of the working capital, retained earnings, EBIT, market value of equity and
+# sales ratios in the Z-Score
+_ALTMAN_WEIGHTS = (1.2, 1.4, 3.3, 0.6, 1.0)
+
 def get_altman_z_score(
         current_assets: pd.Series,
         current_liabilities: pd.Series,
@@ -195,14 +214,85 @@ def get_altman_z_score(
         pd.Series: Time series of Altman Z-Score values. Returns NaN for periods where
                   any denominator (total assets or total liabilities) is zero.
     """
-    # Handle zero denominators by replacing with NaN
-    safe_assets = total_assets.replace(0, np.nan)
-    safe_liabilities = total_liabilities.replace(0, np.nan)
+    index, values = aligned_values(
+        current_assets, current_liabilities, total_assets, ebit, diluted_shares_outstanding,
+        revenue, total_liabilities, retained_earnings, stock_price
+    )
+
+    return pd.Series(_altman_z_score(*values), index=index)
 
-    x_1 = (current_assets - current_liabilities) / safe_assets  # Working Capital ratio
-    x_2 = retained_earnings / safe_assets  # Retained Earnings ratio
-    x_3 = ebit / safe_assets  # Profitability ratio
-    x_4 = (stock_price * diluted_shares_outstanding) / safe_liabilities  # Solvency ratio
-    x_5 = revenue / safe_assets  # Asset Turnover ratio
 
-    return (1.2 * x_1) + (1.4 * x_2) + (3.3 * x_3) + (0.6 * x_4) + (1.0 * x_5)
+def get_altman_z_score_batch(data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Calculate the Altman Z-Score for many tickers at once.
+
+    Equivalent to calling get_altman_z_score for every column, but the score is
+    evaluated once on 2-D arrays instead of once per ticker.
+
+    Args:
+        data (dict[str, pd.DataFrame]): Inputs keyed by the parameter names of
+            get_altman_z_score, each shaped (periods x tickers). The inputs are aligned
+            on the union of their indexes and columns.
+
+    Returns:
+        pd.DataFrame: Time series of Altman Z-Score values per ticker. Returns NaN for
+                  periods where any denominator (total assets or total liabilities) is zero.
+    """
+    names = (
+        'current_assets', 'current_liabilities', 'total_assets', 'ebit',
+        'diluted_shares_outstanding', 'revenue', 'total_liabilities',
+        'retained_earnings', 'stock_price'
+    )
+    frames = [data[name] for name in names]
+
+    index, columns = frames[0].index, frames[0].columns
+    for frame in frames[1:]:
+        if not frame.index.equals(index):
+            index = index.union(frame.index)
+        if not frame.columns.equals(columns):
+            columns = columns.union(frame.columns)
+
+    values = []
+    for frame in frames:
+        frame = frame.reindex(index=index, columns=columns)
+        dtype = np.float32 if (frame.dtypes == np.float32).all() else np.float64
+        values.append(frame.to_numpy(dtype=dtype, na_value=np.nan))
+
+    return pd.DataFrame(_altman_z_score(*values), index=index, columns=columns)
+
+
+def _altman_z_score(
+        current_assets: np.ndarray,
+        current_liabilities: np.ndarray,
+        total_assets: np.ndarray,
+        ebit: np.ndarray,
+        diluted_shares_outstanding: np.ndarray,
+        revenue: np.ndarray,
+        total_liabilities: np.ndarray,
+        retained_earnings: np.ndarray,
+        stock_price: np.ndarray) -> np.ndarray:
+    """Weighted sum of the five Altman ratios, element-wise on aligned arrays."""
+    # Total assets is the denominator of four ratios, so validate it only once
+    per_assets = safe_divide_by(total_assets)
+
+    # Zero denominators give NaN
+    x_1 = per_assets(current_assets - current_liabilities)  # Working Capital ratio
+    x_2 = per_assets(retained_earnings)  # Retained Earnings ratio
+    x_3 = per_assets(ebit)  # Profitability ratio
+    x_4 = safe_divide(stock_price * diluted_shares_outstanding, total_liabilities)  # Solvency ratio
+    x_5 = per_assets(revenue)  # Asset Turnover ratio
+
+    # Weigh the ratios in place and accumulate them, in formula order, into one array
+    terms = (x_1, x_2, x_3, x_4, x_5)
+    for term, weight in zip(terms, _ALTMAN_WEIGHTS):
+        term *= weight
+
+    z_score = terms[0]
+    for term in terms[1:]:
+        if np.result_type(z_score, term) == z_score.dtype:
+            z_score += term
+        else:
+            # A wider term (e.g. float64 next to float32) widens the sum, as pandas would
+            z_score = z_score + term
+
+    return z_score
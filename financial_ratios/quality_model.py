@@ -2,6 +2,8 @@ import pandas as pd
 import numpy as np
 from typing import Union
 
+from financial_ratios.utils.helpers import aligned_values, calculate_rolling_count, safe_divide
+
 """
 Quality Analysis Module
 
@@ -25,6 +27,9 @@ Total Functions: 7
 
 Note: All functions handle invalid calculations (like division by zero) by returning NaN
 values for those specific time periods, maintaining the time series structure.
+
+The ratios and bands are returned in the floating point precision of their inputs, so
+float32 series can be used for large screens where seven significant digits suffice.
 """
 
 # ----------------------
@@ -61,24 +66,27 @@ def get_intrinsic_compounding_rate(
         pd.Series: Time series of AICR values. Returns NaN for periods with zero
                   shareholder equity or net income, or insufficient data.
     """
+    index, (net_income_values, total_assets_values, total_liabilities_values, dividend_values) = \
+        aligned_values(net_income, total_assets, total_liabilities, dividend_paid)
+
     # Handle zero values in inputs
-    safe_net_income = net_income.replace(0, np.nan)
-    safe_total_assets = total_assets.replace(0, np.nan)
-    
+    safe_net_income = np.where(net_income_values == 0, np.nan, net_income_values)
+    safe_total_assets = np.where(total_assets_values == 0, np.nan, total_assets_values)
+
     # Calculate shareholder equity
-    shareholder_equity = safe_total_assets - total_liabilities
-    safe_shareholder_equity = shareholder_equity.replace(0, np.nan)
-    
-    # Calculate ROE and retention ratio
-    return_on_equity = safe_net_income / safe_shareholder_equity
-    dividend_payout_ratio = dividend_paid / safe_net_income
-    retention_ratio = 1 - dividend_payout_ratio.clip(lower=0, upper=1)
-    
-    # Calculate final result
-    result = return_on_equity * retention_ratio
-    
-    # Create a new series to ensure NaN propagation
-    return pd.Series(result, index=net_income.index)
+    shareholder_equity = safe_total_assets - total_liabilities_values
+
+    # Calculate ROE and retention ratio, zero equity gives NaN
+    return_on_equity = safe_divide(safe_net_income, shareholder_equity)
+    dividend_payout_ratio = dividend_values / safe_net_income
+    retention_ratio = 1 - np.clip(dividend_payout_ratio, 0, 1)
+
+    # Calculate final result on the net income periods
+    result = pd.Series(return_on_equity * retention_ratio, index=index)
+    if not index.equals(net_income.index):
+        result = result.reindex(net_income.index)
+
+    return result
 
 # ----------------------
 # 2. Earnings Quality
@@ -102,14 +110,12 @@ def get_dips_in_profit_over_10yrs(
                   insufficient data (less than 10 years).
     """
 
-    # Calculate year-over-year change
-    profit_change = net_profit.pct_change(periods=1) * 100
+    # Calculate year-over-year change, carrying the last known profit over missing periods
+    profit_change = net_profit.ffill().pct_change(periods=1, fill_method=None) * 100
 
-    # Count large dips and handle NaN values
-    large_dips = (profit_change < -10).fillna(False).astype(int)
-    result = large_dips.rolling(window=10,min_periods=1).sum()
-
-    return result
+    # Count large dips over the trailing 10 periods, missing changes (NaN, or pd.NA with
+    # nullable dtypes) never count
+    return calculate_rolling_count(profit_change < -10, window=10)
 
 def get_roic_band(
         invested_capital: pd.Series,
@@ -135,33 +141,44 @@ def get_roic_band(
     Raises:
         ValueError: If less than 5 periods of data are available or if all values are zero/NaN
     """
+    index, (invested_capital_values, ebit_values, tax_rate_values) = \
+        aligned_values(invested_capital, ebit, tax_rate)
+
     # Handle zero values
-    tax_rate = tax_rate.replace(0, np.nan)
-    ebit = ebit.replace(0, np.nan)
-    nopat = ebit * (1 - tax_rate/100)
-    safe_invested_capital = invested_capital.replace(0, np.nan)
-    
-    # Calculate ROIC
-    roic = nopat / safe_invested_capital
+    tax_rate_values = np.where(tax_rate_values == 0, np.nan, tax_rate_values)
+    ebit_values = np.where(ebit_values == 0, np.nan, ebit_values)
+    nopat = ebit_values * (1 - tax_rate_values/100)
+
+    # Calculate ROIC, zero invested capital gives NaN
+    roic = pd.Series(safe_divide(nopat, invested_capital_values), index=index)
 
     # Check for all NaN or zero values
     if roic.isna().all() or (roic == 0).all() or len(roic.dropna()) < 5:
         raise ValueError("Insufficient data: At least 5 periods of non-zero ROIC required.")
 
-    # Calculate rolling statistics with NaN handling
-    mean_roic = roic.rolling(window=10, min_periods=1).mean()
-    std_roic = roic.rolling(window=10, min_periods=1).std()
-    
-    # Handle zero standard deviation
-    safe_std_roic = std_roic.replace(0, np.nan)
-    
-    return (roic - mean_roic) / safe_std_roic
+    return _band(roic)
+
+def _band(values: pd.Series | pd.DataFrame, window: int = 10) -> pd.Series | pd.DataFrame:
+    """
+    Deviation of each value from its trailing mean, in trailing standard deviations.
+
+    The mean and standard deviation share one rolling window, which runs over every
+    column at once for (periods x tickers) frames. Zero standard deviation gives NaN.
+    """
+    rolling = values.rolling(window=window, min_periods=1)
+    band = safe_divide(values - rolling.mean(), rolling.std())
+
+    # rolling always returns float64, keep the precision of the input (e.g. float32)
+    dtypes = set(values.dtypes) if isinstance(values, pd.DataFrame) else {values.dtype}
+    if dtypes == {np.dtype(np.float32)}:
+        band = band.astype(np.float32)
+    return band
 
 # ------------------------
 # 3. Cash Flow Quality
 # ------------------------
 
-def get_cfo_band(cfo: pd.Series) -> pd.Series:
+def get_cfo_band(cfo: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
     """
     Calculate the Cash Flow from Operations (CFO) Band percentage by comparing current CFO
     to its historical mean and standard deviation over 5-10 years.
@@ -170,24 +187,18 @@ def get_cfo_band(cfo: pd.Series) -> pd.Series:
     signal changes in business quality or potential accounting issues.
 
     Args:
-        cfo (pd.Series): Time series of Cash Flow from Operations values
+        cfo (pd.Series | pd.DataFrame): Time series of Cash Flow from Operations values,
+            or a (periods x tickers) frame of them to calculate every ticker at once
 
     Returns:
-        pd.Series: Time series of CFO deviation values (in standard deviations from mean).
-                  Returns NaN for periods with insufficient data or zero standard deviation.
+        pd.Series | pd.DataFrame: Time series of CFO deviation values (in standard deviations
+                  from mean). Returns NaN for periods with insufficient data or zero standard
+                  deviation.
 
     Raises:
         ValueError: If less than 5 periods of data are available
     """
-
-    # Calculate rolling statistics with NaN handling
-    mean_cfo = cfo.rolling(window=10, min_periods=1).mean()
-    std_cfo = cfo.rolling(window=10, min_periods=1).std()
-    
-    # Handle zero standard deviation
-    safe_std_cfo = std_cfo.replace(0, np.nan)
-    
-    return (cfo - mean_cfo) / safe_std_cfo
+    return _band(cfo)
 
 def get_negative_dips_in_fcf_over_10yrs(fcf: pd.Series) -> pd.Series:
     """
@@ -206,11 +217,8 @@ def get_negative_dips_in_fcf_over_10yrs(fcf: pd.Series) -> pd.Series:
     """
     fcf_change = fcf.diff(periods=1)
 
-    # Count negative changes and ensure integer output
-    negative_changes = (fcf_change < 0).fillna(False).astype('int64')
-    rolling_sum = negative_changes.rolling(window=10, min_periods=1).sum()
-    
-    return rolling_sum
+    # Count negative changes over the trailing 10 periods
+    return calculate_rolling_count(fcf_change < 0, window=10)
 
 def get_negative_fcf_years(fcf: pd.Series) -> pd.Series:
     """
@@ -226,10 +234,8 @@ def get_negative_fcf_years(fcf: pd.Series) -> pd.Series:
         pd.Series: Time series of cumulative negative FCF year counts. Returns NaN for
                   periods with insufficient data (less than 10 years).
     """
-    # Count negative FCF years and ensure integer output
-    negative_years = (fcf < 0).fillna(False).astype('int64')
-    rolling_sum = negative_years.rolling(window=10, min_periods=1).sum()
-    return rolling_sum
+    # Count negative FCF years over the trailing 10 periods
+    return calculate_rolling_count(fcf < 0, window=10)
 
 def get_cfo_to_net_profit(
         cfo: pd.Series,
@@ -254,11 +260,8 @@ def get_cfo_to_net_profit(
     Raises:
         ValueError: If less than 5 periods of data are available
     """
-    # Handle zero values
-    safe_net_profit = net_profit.replace(0, np.nan)
-    
-    # Calculate FCF to Net Profit ratio
-    ratio = cfo / safe_net_profit
+    # Calculate FCF to Net Profit ratio, zero net profit gives NaN
+    ratio = safe_divide(cfo, net_profit)
 
     # # Calculate rolling statistics with NaN handling
     # mean_ratio = ratio.rolling(window=10, min_periods=1).mean()
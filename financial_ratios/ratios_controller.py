@@ -1,11 +1,46 @@
 """Ratios Module"""
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import wraps
+
 import pandas as pd
 
-from financial_ratios.utils.helpers import calculate_growth, handle_errors, calculate_average, FrequencyType, freq
+from financial_ratios.utils.helpers import calculate_growth, handle_errors, calculate_average, mask_infinite, FrequencyType, freq
 from . import financial_health_model, earnings_model, quality_model, valuation_model
 
 
+def _cache_collected(func):
+    """
+    Decorator caching the result of a collect_* method per set of arguments.
+
+    A Ratios instance works on its own copy of the financial data, which nothing changes after
+    construction, so repeated calls with the same arguments return a copy of the cached result
+    instead of recalculating every ratio.
+
+    Args:
+        func (function): The collect_* method to be decorated.
+
+    Returns:
+        function: The decorated method.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (
+            func.__name__,
+            tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args),
+            tuple(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in sorted(kwargs.items())
+            ),
+        )
+        if key not in self._collect_cache:
+            self._collect_cache[key] = func(self, *args, **kwargs)
+        return self._collect_cache[key].copy()
+
+    return wrapper
+
+
 class Ratios:
     """
     The Ratios Module contains financial health ratios that can be used to analyse companies.
@@ -19,6 +54,7 @@ class Ratios:
         financial_data: pd.DataFrame,
         quarterly: bool = False,
         rounding: int | None = 4,
+        float32: bool = False,
     ):
         """
         Initializes the Ratios Controller Class.
@@ -35,14 +71,30 @@ class Ratios:
                 - 'Current_Assets': Total Current Assets values
                 - 'Current_Liabilities': Total Current Liabilities values
                 etc...
+                The data is copied, so changing the DataFrame afterwards does not affect the ratios.
             quarterly (bool, optional): Whether to use quarterly data. Defaults to False.
             rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
-        """
+            float32 (bool, optional): Whether to downcast the float64 columns of the financial data
+                to float32, halving the memory the ratio calculations stream through at the cost of
+                precision beyond about seven significant digits. The ratios are then returned as
+                float32 as well. Defaults to False.
+        """
+        if float32:
+            columns = financial_data.select_dtypes(include='float64').columns
+            financial_data = financial_data.astype(dict.fromkeys(columns, 'float32'))
+        else:
+            # The transformed columns and ratios are cached, so keep them in line with a private copy
+            financial_data = financial_data.copy()
+
         self._tickers = tickers
         self._exchange = exchange
         self._financial_data = financial_data
         self._rounding = rounding
         self._quarterly = quarterly
+        self._float32 = float32
+
+        # Number of days in a period, used when no days are passed to the cash conversion cycle
+        self._days = 365 / 4 if quarterly else 365
         
         # Initialize ratio storage
         self._financial_health_ratios = pd.DataFrame()
@@ -54,6 +106,15 @@ class Ratios:
         self._valuation_ratios = pd.DataFrame()
         self._valuation_ratios_growth = pd.DataFrame()
 
+        # Cache of frequency transformed columns, keyed by (column, frequency)
+        self._frequency_cache: dict[tuple[str, FrequencyType | None], pd.Series] = {}
+
+        # Cache of trailing window aggregates, keyed by (column, frequency, trailing, aggregation)
+        self._trailing_cache: dict[tuple[str, FrequencyType | None, int, str], pd.Series] = {}
+
+        # Cache of collected ratios, keyed by method and arguments
+        self._collect_cache: dict[tuple, pd.DataFrame] = {}
+
 
     def _process_ratio_result(
         self,
@@ -83,12 +144,79 @@ class Ratios:
             )
         else:
             result = result.round(rounding if rounding else self._rounding)
+
+        if self._float32:
+            # Ratios that pass through float64 steps (e.g. rolling counts) are returned as float32 too
+            columns = result.select_dtypes(include='float64').columns
+            if len(columns):
+                result = result.astype(dict.fromkeys(columns, 'float32'))
         return result
 
 
+    def _get_frequency_data(self, column: str, freq: FrequencyType | None) -> pd.Series:
+        """
+        Return a column of the financial data transformed to the requested frequency.
+
+        The transformation is cached per column and frequency so that the fiscal year
+        and TTM aggregations are only computed once, however many ratios use the column.
+
+        Args:
+            column (str): The column of the financial data to transform.
+            freq (FrequencyType | None): Frequency type to apply (FY for fiscal year, TTM for trailing
+                twelve months). None returns the column as is.
+
+        Returns:
+            pd.Series: The transformed column.
+        """
+        key = (column, freq)
+        if key not in self._frequency_cache:
+            series = self._financial_data[column]
+            if freq == FrequencyType.FY:
+                series = series.freq.FY(exchange=self._exchange)
+            elif freq == FrequencyType.TTM:
+                series = series.freq.TTM
+            self._frequency_cache[key] = series
+        return self._frequency_cache[key]
+
+
+    def _get_trailing_data(
+        self,
+        column: str,
+        trailing: int,
+        aggregation: str,
+        freq: FrequencyType | None = None,
+    ) -> pd.Series:
+        """
+        Return the trailing window aggregate of a column of the financial data.
+
+        The aggregate is cached per column, frequency, window and aggregation so that
+        the rolling pass is only computed once, however many ratios use the column.
+
+        Args:
+            column (str): The column of the financial data to aggregate.
+            trailing (int): The number of periods in the trailing window.
+            aggregation (str): The rolling aggregation to apply ('mean' or 'sum').
+            freq (FrequencyType | None, optional): Frequency type to apply before the
+                trailing window. Defaults to None, which uses the column as is.
+
+        Returns:
+            pd.Series: The aggregated column.
+        """
+        key = (column, freq, trailing, aggregation)
+        if key not in self._trailing_cache:
+            series = self._get_frequency_data(column, freq)
+            if trailing == 1:
+                # A one-period window is the values themselves, rolling gives float64 with NaN for infinities
+                self._trailing_cache[key] = mask_infinite(series.astype('float64'))
+            else:
+                self._trailing_cache[key] = series.rolling(trailing).agg(aggregation)
+        return self._trailing_cache[key]
+
+
     ################ Financial Health Model Ratios ###############
 
     @handle_errors
+    @_cache_collected
     def collect_financial_health_ratios(
         self,
         rounding: int | None = None,
@@ -161,16 +289,16 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year (April-March) calculations
-                total_debt = total_debt.freq.FY(exchange=self._exchange)
-                total_equity = total_equity.freq.FY(exchange=self._exchange)
+                total_debt = self._get_frequency_data('Total Debt', FrequencyType.FY)
+                total_equity = self._get_frequency_data('Total Equity', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                total_debt = total_debt.freq.TTM
-                total_equity = total_equity.freq.TTM
+                total_debt = self._get_frequency_data('Total Debt', FrequencyType.TTM)
+                total_equity = self._get_frequency_data('Total Equity', FrequencyType.TTM)
         # Apply trailing window if specified (for backward compatibility)
         if trailing:
-            total_debt = total_debt.rolling(trailing).mean()
-            total_equity = total_equity.rolling(trailing).mean()
+            total_debt = self._get_trailing_data('Total Debt', trailing, 'mean', freq)
+            total_equity = self._get_trailing_data('Total Equity', trailing, 'mean', freq)
         # Name based on frequency used
         ratio_name = 'Debt to Equity'
         if freq == FrequencyType.TTM:
@@ -217,16 +345,16 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                ebit = ebit.freq.FY(exchange=self._exchange)
-                interest_expense = interest_expense.freq.FY(exchange=self._exchange)
+                ebit = self._get_frequency_data('EBIT', FrequencyType.FY)
+                interest_expense = self._get_frequency_data('Interest Expense', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                ebit = ebit.freq.TTM
-                interest_expense = interest_expense.freq.TTM
+                ebit = self._get_frequency_data('EBIT', FrequencyType.TTM)
+                interest_expense = self._get_frequency_data('Interest Expense', FrequencyType.TTM)
         # Apply trailing window if specified (for backward compatibility)
         elif trailing:
-            ebit = ebit.rolling(trailing).sum()
-            interest_expense = interest_expense.rolling(trailing).sum()
+            ebit = self._get_trailing_data('EBIT', trailing, 'sum', freq)
+            interest_expense = self._get_trailing_data('Interest Expense', trailing, 'sum', freq)
 
         result = financial_health_model.get_interest_coverage_ratio(ebit, interest_expense)
 
@@ -271,16 +399,16 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                current_assets = current_assets.freq.FY(exchange=self._exchange)
-                current_liabilities = current_liabilities.freq.FY(exchange=self._exchange)
+                current_assets = self._get_frequency_data('Total Current Assets', FrequencyType.FY)
+                current_liabilities = self._get_frequency_data('Total Current Liabilities', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                current_assets = current_assets.freq.TTM
-                current_liabilities = current_liabilities.freq.TTM
+                current_assets = self._get_frequency_data('Total Current Assets', FrequencyType.TTM)
+                current_liabilities = self._get_frequency_data('Total Current Liabilities', FrequencyType.TTM)
         # Apply trailing window if specified (for backward compatibility)
         if trailing:
-            current_assets = current_assets.rolling(trailing).mean()
-            current_liabilities = current_liabilities.rolling(trailing).mean()
+            current_assets = self._get_trailing_data('Total Current Assets', trailing, 'mean', freq)
+            current_liabilities = self._get_trailing_data('Total Current Liabilities', trailing, 'mean', freq)
 
         result = financial_health_model.get_current_ratio(current_assets, current_liabilities)
 
@@ -322,7 +450,7 @@ class Ratios:
             pd.DataFrame: Cash conversion cycle values.
         """
         if not days:
-            days = 365 / 4 if self._quarterly else 365
+            days = self._days
 
         # Get required series from financial data
         inventory = self._financial_data['Total Inventories']
@@ -335,25 +463,25 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                inventory = inventory.freq.FY(exchange=self._exchange)
-                cogs = cogs.freq.FY(exchange=self._exchange)
-                accounts_receivable = accounts_receivable.freq.FY(exchange=self._exchange)
-                revenue = revenue.freq.FY(exchange=self._exchange)
-                accounts_payable = accounts_payable.freq.FY(exchange=self._exchange)
+                inventory = self._get_frequency_data('Total Inventories', FrequencyType.FY)
+                cogs = self._get_frequency_data('Cost of Goods Sold', FrequencyType.FY)
+                accounts_receivable = self._get_frequency_data('Accounts Receivable', FrequencyType.FY)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.FY)
+                accounts_payable = self._get_frequency_data('Accounts Payable', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                inventory = inventory.freq.TTM
-                cogs = cogs.freq.TTM
-                accounts_receivable = accounts_receivable.freq.TTM
-                revenue = revenue.freq.TTM
-                accounts_payable = accounts_payable.freq.TTM
+                inventory = self._get_frequency_data('Total Inventories', FrequencyType.TTM)
+                cogs = self._get_frequency_data('Cost of Goods Sold', FrequencyType.TTM)
+                accounts_receivable = self._get_frequency_data('Accounts Receivable', FrequencyType.TTM)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.TTM)
+                accounts_payable = self._get_frequency_data('Accounts Payable', FrequencyType.TTM)
         # Apply trailing window if specified (for backward compatibility)
         if trailing:
-            inventory = inventory.rolling(trailing).mean()
-            cogs = cogs.rolling(trailing).sum()
-            accounts_receivable = accounts_receivable.rolling(trailing).mean()
-            revenue = revenue.rolling(trailing).sum()
-            accounts_payable = accounts_payable.rolling(trailing).mean()
+            inventory = self._get_trailing_data('Total Inventories', trailing, 'mean', freq)
+            cogs = self._get_trailing_data('Cost of Goods Sold', trailing, 'sum', freq)
+            accounts_receivable = self._get_trailing_data('Accounts Receivable', trailing, 'mean', freq)
+            revenue = self._get_trailing_data('Revenue', trailing, 'sum', freq)
+            accounts_payable = self._get_trailing_data('Accounts Payable', trailing, 'mean', freq)
 
         result = financial_health_model.get_cash_conversion_cycle(
             inventory, cogs, accounts_receivable, revenue, accounts_payable, days
@@ -409,36 +537,36 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                current_assets = current_assets.freq.FY(exchange=self._exchange)
-                current_liabilities = current_liabilities.freq.FY(exchange=self._exchange)
-                total_assets = total_assets.freq.FY(exchange=self._exchange)
-                ebit = ebit.freq.FY(exchange=self._exchange)
-                diluted_shares = diluted_shares.freq.FY(exchange=self._exchange)
-                revenue = revenue.freq.FY(exchange=self._exchange)
-                total_liabilities = total_liabilities.freq.FY(exchange=self._exchange)
-                retained_earnings = retained_earnings.freq.FY(exchange=self._exchange)
+                current_assets = self._get_frequency_data('Total Current Assets', FrequencyType.FY)
+                current_liabilities = self._get_frequency_data('Total Current Liabilities', FrequencyType.FY)
+                total_assets = self._get_frequency_data('Total Assets', FrequencyType.FY)
+                ebit = self._get_frequency_data('EBIT', FrequencyType.FY)
+                diluted_shares = self._get_frequency_data('Shares Outstanding', FrequencyType.FY)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.FY)
+                total_liabilities = self._get_frequency_data('Total Liabilities', FrequencyType.FY)
+                retained_earnings = self._get_frequency_data('Retained Earnings', FrequencyType.FY)
                 # Stock price doesn't get frequency transformation
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                current_assets = current_assets.freq.TTM
-                current_liabilities = current_liabilities.freq.TTM
-                total_assets = total_assets.freq.TTM
-                ebit = ebit.freq.TTM
-                diluted_shares = diluted_shares.freq.TTM
-                revenue = revenue.freq.TTM
-                total_liabilities = total_liabilities.freq.TTM
-                retained_earnings = retained_earnings.freq.TTM
+                current_assets = self._get_frequency_data('Total Current Assets', FrequencyType.TTM)
+                current_liabilities = self._get_frequency_data('Total Current Liabilities', FrequencyType.TTM)
+                total_assets = self._get_frequency_data('Total Assets', FrequencyType.TTM)
+                ebit = self._get_frequency_data('EBIT', FrequencyType.TTM)
+                diluted_shares = self._get_frequency_data('Shares Outstanding', FrequencyType.TTM)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.TTM)
+                total_liabilities = self._get_frequency_data('Total Liabilities', FrequencyType.TTM)
+                retained_earnings = self._get_frequency_data('Retained Earnings', FrequencyType.TTM)
                 # Stock price doesn't get frequency transformation
         # Apply trailing window if specified (for backward compatibility)
         if trailing:
-            current_assets = current_assets.rolling(trailing).mean()
-            current_liabilities = current_liabilities.rolling(trailing).mean()
-            total_assets = total_assets.rolling(trailing).mean()
-            ebit = ebit.rolling(trailing).sum()
-            diluted_shares = diluted_shares.rolling(trailing).mean()
-            revenue = revenue.rolling(trailing).sum()
-            total_liabilities = total_liabilities.rolling(trailing).mean()
-            retained_earnings = retained_earnings.rolling(trailing).mean()
+            current_assets = self._get_trailing_data('Total Current Assets', trailing, 'mean', freq)
+            current_liabilities = self._get_trailing_data('Total Current Liabilities', trailing, 'mean', freq)
+            total_assets = self._get_trailing_data('Total Assets', trailing, 'mean', freq)
+            ebit = self._get_trailing_data('EBIT', trailing, 'sum', freq)
+            diluted_shares = self._get_trailing_data('Shares Outstanding', trailing, 'mean', freq)
+            revenue = self._get_trailing_data('Revenue', trailing, 'sum', freq)
+            total_liabilities = self._get_trailing_data('Total Liabilities', trailing, 'mean', freq)
+            retained_earnings = self._get_trailing_data('Retained Earnings', trailing, 'mean', freq)
 
         result = financial_health_model.get_altman_z_score(
             current_assets, current_liabilities, total_assets,
@@ -461,6 +589,7 @@ class Ratios:
     ################ Earnings Model Ratios ###############
 
     @handle_errors
+    @_cache_collected
     def collect_earning_ratios(
             self,
             rounding: int | None = None,
@@ -622,35 +751,35 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                net_income = net_income.freq.FY(exchange=self._exchange)
-                operating_cash_flow = operating_cash_flow.freq.FY(exchange=self._exchange)
-                total_assets = total_assets.freq.FY(exchange=self._exchange)
-                total_debt = total_debt.freq.FY(exchange=self._exchange)
-                current_assets = current_assets.freq.FY(exchange=self._exchange)
-                current_liabilities = current_liabilities.freq.FY(exchange=self._exchange)
-                revenue = revenue.freq.FY(exchange=self._exchange)
-                cogs = cogs.freq.FY(exchange=self._exchange)
+                net_income = self._get_frequency_data('Net Income', FrequencyType.FY)
+                operating_cash_flow = self._get_frequency_data('Operating Cash Flow', FrequencyType.FY)
+                total_assets = self._get_frequency_data('Total Assets', FrequencyType.FY)
+                total_debt = self._get_frequency_data('Total Debt', FrequencyType.FY)
+                current_assets = self._get_frequency_data('Total Current Assets', FrequencyType.FY)
+                current_liabilities = self._get_frequency_data('Total Current Liabilities', FrequencyType.FY)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.FY)
+                cogs = self._get_frequency_data('Cost of Goods Sold', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                net_income = net_income.freq.TTM
-                operating_cash_flow = operating_cash_flow.freq.TTM
-                total_assets = total_assets.freq.TTM
-                total_debt = total_debt.freq.TTM
-                current_assets = current_assets.freq.TTM
-                current_liabilities = current_liabilities.freq.TTM
-                revenue = revenue.freq.TTM
-                cogs = cogs.freq.TTM
+                net_income = self._get_frequency_data('Net Income', FrequencyType.TTM)
+                operating_cash_flow = self._get_frequency_data('Operating Cash Flow', FrequencyType.TTM)
+                total_assets = self._get_frequency_data('Total Assets', FrequencyType.TTM)
+                total_debt = self._get_frequency_data('Total Debt', FrequencyType.TTM)
+                current_assets = self._get_frequency_data('Total Current Assets', FrequencyType.TTM)
+                current_liabilities = self._get_frequency_data('Total Current Liabilities', FrequencyType.TTM)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.TTM)
+                cogs = self._get_frequency_data('Cost of Goods Sold', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            net_income = net_income.rolling(trailing).mean()
-            operating_cash_flow = operating_cash_flow.rolling(trailing).mean()
-            total_assets = total_assets.rolling(trailing).mean()
-            total_debt = total_debt.rolling(trailing).mean()
-            current_assets = current_assets.rolling(trailing).mean()
-            current_liabilities = current_liabilities.rolling(trailing).mean()
-            revenue = revenue.rolling(trailing).mean()
-            cogs = cogs.rolling(trailing).mean()
+            net_income = self._get_trailing_data('Net Income', trailing, 'mean', freq)
+            operating_cash_flow = self._get_trailing_data('Operating Cash Flow', trailing, 'mean', freq)
+            total_assets = self._get_trailing_data('Total Assets', trailing, 'mean', freq)
+            total_debt = self._get_trailing_data('Total Debt', trailing, 'mean', freq)
+            current_assets = self._get_trailing_data('Total Current Assets', trailing, 'mean', freq)
+            current_liabilities = self._get_trailing_data('Total Current Liabilities', trailing, 'mean', freq)
+            revenue = self._get_trailing_data('Revenue', trailing, 'mean', freq)
+            cogs = self._get_trailing_data('Cost of Goods Sold', trailing, 'mean', freq)
 
         # Calculate Piotroski score using earnings model
         result = earnings_model.get_piotroski_score(
@@ -712,14 +841,14 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                revenue = revenue.freq.FY(exchange=self._exchange)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                revenue = revenue.freq.TTM
+                revenue = self._get_frequency_data('Revenue', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            revenue = revenue.rolling(trailing).mean()
+            revenue = self._get_trailing_data('Revenue', trailing, 'mean', freq)
 
         # Calculate revenue growth using earnings model
         result = earnings_model.get_revenue_growth(revenue)
@@ -771,14 +900,14 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                eps = eps.freq.FY(exchange=self._exchange)
+                eps = self._get_frequency_data('Basic EPS', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                eps = eps.freq.TTM
+                eps = self._get_frequency_data('Basic EPS', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            eps = eps.rolling(trailing).mean()
+            eps = self._get_trailing_data('Basic EPS', trailing, 'mean', freq)
 
         # Calculate EPS growth using earnings model
         result = earnings_model.get_eps_growth(eps)
@@ -837,17 +966,17 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                net_income = net_income.freq.FY(exchange=self._exchange)
+                net_income = self._get_frequency_data('Net Income', FrequencyType.FY)
                 shareholders_equity = shareholders_equity.freq.FY(exchange=self._exchange)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                net_income = net_income.freq.TTM
+                net_income = self._get_frequency_data('Net Income', FrequencyType.TTM)
                 shareholders_equity = shareholders_equity.freq.TTM / 4
 
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            net_income = net_income.rolling(trailing).mean()
+            net_income = self._get_trailing_data('Net Income', trailing, 'mean', freq)
             shareholders_equity = shareholders_equity.rolling(trailing).mean()
 
         result = earnings_model.get_return_on_equity(net_income, shareholders_equity)
@@ -896,14 +1025,14 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                fcf = fcf.freq.FY(exchange=self._exchange)
+                fcf = self._get_frequency_data('Free Cash Flow', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                fcf = fcf.freq.TTM
+                fcf = self._get_frequency_data('Free Cash Flow', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            fcf = fcf.rolling(trailing).mean()
+            fcf = self._get_trailing_data('Free Cash Flow', trailing, 'mean', freq)
 
         result = earnings_model.get_free_cash_flow_growth(fcf)
 
@@ -951,14 +1080,14 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                revenue = revenue.freq.FY(exchange=self._exchange)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                revenue = revenue.freq.TTM
+                revenue = self._get_frequency_data('Revenue', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            revenue = revenue.rolling(trailing).mean()
+            revenue = self._get_trailing_data('Revenue', trailing, 'mean', freq)
 
         result = earnings_model.get_revenue_consecutive_growth(revenue)
 
@@ -1006,14 +1135,14 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                eps = eps.freq.FY(exchange=self._exchange)
+                eps = self._get_frequency_data('Basic EPS', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                eps = eps.freq.TTM
+                eps = self._get_frequency_data('Basic EPS', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            eps = eps.rolling(trailing).mean()
+            eps = self._get_trailing_data('Basic EPS', trailing, 'mean', freq)
 
         result = earnings_model.get_eps_consecutive_growth(eps)
 
@@ -1061,14 +1190,14 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                revenue = revenue.freq.FY(exchange=self._exchange)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                revenue = revenue.freq.TTM
+                revenue = self._get_frequency_data('Revenue', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            revenue = revenue.rolling(trailing).mean()
+            revenue = self._get_trailing_data('Revenue', trailing, 'mean', freq)
 
         result = earnings_model.get_average_revenue_growth(revenue)
 
@@ -1116,14 +1245,14 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                gross_margin = gross_margin.freq.FY(exchange=self._exchange)
+                gross_margin = self._get_frequency_data('Gross Margin', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                gross_margin = gross_margin.freq.TTM
+                gross_margin = self._get_frequency_data('Gross Margin', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            gross_margin = gross_margin.rolling(trailing).mean()
+            gross_margin = self._get_trailing_data('Gross Margin', trailing, 'mean', freq)
 
         result = earnings_model.get_average_gross_margin(gross_margin)
 
@@ -1171,14 +1300,14 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                gross_margin = gross_margin.freq.FY(exchange=self._exchange)
+                gross_margin = self._get_frequency_data('Gross Margin', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                gross_margin = gross_margin.freq.TTM
+                gross_margin = self._get_frequency_data('Gross Margin', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            gross_margin = gross_margin.rolling(trailing).mean()
+            gross_margin = self._get_trailing_data('Gross Margin', trailing, 'mean', freq)
 
         result = earnings_model.get_average_gross_margin_growth(gross_margin)
 
@@ -1227,17 +1356,17 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                ebitda = ebitda.freq.FY(exchange=self._exchange)
-                revenue = revenue.freq.FY(exchange=self._exchange)
+                ebitda = self._get_frequency_data('EBITDA', FrequencyType.FY)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                ebitda = ebitda.freq.TTM
-                revenue = revenue.freq.TTM
+                ebitda = self._get_frequency_data('EBITDA', FrequencyType.TTM)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            ebitda = ebitda.rolling(trailing).mean()
-            revenue = revenue.rolling(trailing).mean()
+            ebitda = self._get_trailing_data('EBITDA', trailing, 'mean', freq)
+            revenue = self._get_trailing_data('Revenue', trailing, 'mean', freq)
 
         result = earnings_model.get_average_ebitda_margin(ebitda, revenue)
 
@@ -1286,17 +1415,17 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                ebitda = ebitda.freq.FY(exchange=self._exchange)
-                revenue = revenue.freq.FY(exchange=self._exchange)
+                ebitda = self._get_frequency_data('EBITDA', FrequencyType.FY)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                ebitda = ebitda.freq.TTM
-                revenue = revenue.freq.TTM
+                ebitda = self._get_frequency_data('EBITDA', FrequencyType.TTM)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            ebitda = ebitda.rolling(trailing).mean()
-            revenue = revenue.rolling(trailing).mean()
+            ebitda = self._get_trailing_data('EBITDA', trailing, 'mean', freq)
+            revenue = self._get_trailing_data('Revenue', trailing, 'mean', freq)
 
         result = earnings_model.get_average_ebitda_margin_growth(ebitda, revenue)
 
@@ -1344,14 +1473,14 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                eps = eps.freq.FY(exchange=self._exchange)
+                eps = self._get_frequency_data('Basic EPS', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                eps = eps.freq.TTM
+                eps = self._get_frequency_data('Basic EPS', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            eps = eps.rolling(trailing).mean()
+            eps = self._get_trailing_data('Basic EPS', trailing, 'mean', freq)
 
         result = earnings_model.get_average_eps_growth(eps)
 
@@ -1401,14 +1530,14 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                revenue = revenue.freq.FY(exchange=self._exchange)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                revenue = revenue.freq.TTM
+                revenue = self._get_frequency_data('Revenue', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            revenue = revenue.rolling(trailing).mean()
+            revenue = self._get_trailing_data('Revenue', trailing, 'mean', freq)
 
         result = earnings_model.get_revenue_growth_vs_average_growth(revenue)
 
@@ -1456,14 +1585,14 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                eps = eps.freq.FY(exchange=self._exchange)
+                eps = self._get_frequency_data('Basic EPS', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                eps = eps.freq.TTM
+                eps = self._get_frequency_data('Basic EPS', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            eps = eps.rolling(trailing).mean()
+            eps = self._get_trailing_data('Basic EPS', trailing, 'mean', freq)
 
         result = earnings_model.get_eps_growth_vs_average_growth(eps)
 
@@ -1512,17 +1641,17 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                ebitda = ebitda.freq.FY(exchange=self._exchange)
-                revenue = revenue.freq.FY(exchange=self._exchange)
+                ebitda = self._get_frequency_data('EBITDA', FrequencyType.FY)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                ebitda = ebitda.freq.TTM
-                revenue = revenue.freq.TTM
+                ebitda = self._get_frequency_data('EBITDA', FrequencyType.TTM)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            ebitda = ebitda.rolling(trailing).mean()
-            revenue = revenue.rolling(trailing).mean()
+            ebitda = self._get_trailing_data('EBITDA', trailing, 'mean', freq)
+            revenue = self._get_trailing_data('Revenue', trailing, 'mean', freq)
 
         result = earnings_model.get_ebitda_margin_vs_average(ebitda, revenue)
 
@@ -1571,17 +1700,17 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                gross_profit = gross_profit.freq.FY(exchange=self._exchange)
-                revenue = revenue.freq.FY(exchange=self._exchange)
+                gross_profit = self._get_frequency_data('Gross Profit', FrequencyType.FY)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                gross_profit = gross_profit.freq.TTM
-                revenue = revenue.freq.TTM
+                gross_profit = self._get_frequency_data('Gross Profit', FrequencyType.TTM)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            gross_profit = gross_profit.rolling(trailing).mean()
-            revenue = revenue.rolling(trailing).mean()
+            gross_profit = self._get_trailing_data('Gross Profit', trailing, 'mean', freq)
+            revenue = self._get_trailing_data('Revenue', trailing, 'mean', freq)
 
         result = earnings_model.get_gross_margin_vs_average(gross_profit, revenue)
 
@@ -1638,16 +1767,16 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                net_income = net_income.freq.FY(exchange=self._exchange)
+                net_income = self._get_frequency_data('Net Income', FrequencyType.FY)
                 shareholders_equity = shareholders_equity.freq.FY(exchange=self._exchange)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                net_income = net_income.freq.TTM
+                net_income = self._get_frequency_data('Net Income', FrequencyType.TTM)
                 shareholders_equity = shareholders_equity.freq.TTM / 4
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            net_income = net_income.rolling(trailing).mean()
+            net_income = self._get_trailing_data('Net Income', trailing, 'mean', freq)
 
         result = earnings_model.get_roe_vs_average_roe(net_income, shareholders_equity)
 
@@ -1697,16 +1826,16 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                net_income = net_income.freq.FY(exchange=self._exchange)
-                total_assets = total_assets.freq.FY(exchange=self._exchange)
+                net_income = self._get_frequency_data('Net Income', FrequencyType.FY)
+                total_assets = self._get_frequency_data('Total Assets', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                net_income = net_income.freq.TTM
-                total_assets = total_assets.freq.TTM / 4
+                net_income = self._get_frequency_data('Net Income', FrequencyType.TTM)
+                total_assets = self._get_frequency_data('Total Assets', FrequencyType.TTM) / 4
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            net_income = net_income.rolling(trailing).mean()
+            net_income = self._get_trailing_data('Net Income', trailing, 'mean', freq)
             total_assets = total_assets.rolling(trailing).mean()
 
         result = earnings_model.get_return_on_assets(net_income, total_assets)
@@ -1757,16 +1886,16 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                net_income = net_income.freq.FY(exchange=self._exchange)
-                total_assets = total_assets.freq.FY(exchange=self._exchange)
+                net_income = self._get_frequency_data('Net Income', FrequencyType.FY)
+                total_assets = self._get_frequency_data('Total Assets', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                net_income = net_income.freq.TTM
-                total_assets = total_assets.freq.TTM / 4
+                net_income = self._get_frequency_data('Net Income', FrequencyType.TTM)
+                total_assets = self._get_frequency_data('Total Assets', FrequencyType.TTM) / 4
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            net_income = net_income.rolling(trailing).mean()
+            net_income = self._get_trailing_data('Net Income', trailing, 'mean', freq)
             total_assets = total_assets.rolling(trailing).mean()
 
         result = earnings_model.get_roa_vs_average_roa(net_income, total_assets)
@@ -1819,17 +1948,17 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                revenue = revenue.freq.FY(exchange=self._exchange)
-                revenue_estimate = revenue_estimate.freq.FY(exchange=self._exchange)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.FY)
+                revenue_estimate = self._get_frequency_data('Revenue Estimate', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                revenue = revenue.freq.TTM
-                revenue_estimate = revenue_estimate.freq.TTM
+                revenue = self._get_frequency_data('Revenue', FrequencyType.TTM)
+                revenue_estimate = self._get_frequency_data('Revenue Estimate', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            revenue = revenue.rolling(trailing).mean()
-            revenue_estimate = revenue_estimate.rolling(trailing).mean()
+            revenue = self._get_trailing_data('Revenue', trailing, 'mean', freq)
+            revenue_estimate = self._get_trailing_data('Revenue Estimate', trailing, 'mean', freq)
 
         result = earnings_model.get_revenue_vs_estimate(revenue, revenue_estimate)
 
@@ -1884,23 +2013,23 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                net_income = net_income.freq.FY(exchange=self._exchange)
-                eps = eps.freq.FY(exchange=self._exchange)
-                net_income_estimate = net_income_estimate.freq.FY(exchange=self._exchange)
-                eps_estimate = eps_estimate.freq.FY(exchange=self._exchange)
+                net_income = self._get_frequency_data('Net Income', FrequencyType.FY)
+                eps = self._get_frequency_data('Basic EPS', FrequencyType.FY)
+                net_income_estimate = self._get_frequency_data('Net Income Estimate', FrequencyType.FY)
+                eps_estimate = self._get_frequency_data('EPS Estimate', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                net_income = net_income.freq.TTM
-                eps = eps.freq.TTM
-                net_income_estimate = net_income_estimate.freq.TTM
-                eps_estimate = eps_estimate.freq.TTM
+                net_income = self._get_frequency_data('Net Income', FrequencyType.TTM)
+                eps = self._get_frequency_data('Basic EPS', FrequencyType.TTM)
+                net_income_estimate = self._get_frequency_data('Net Income Estimate', FrequencyType.TTM)
+                eps_estimate = self._get_frequency_data('EPS Estimate', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            net_income = net_income.rolling(trailing).mean()
-            eps = eps.rolling(trailing).mean()
-            net_income_estimate = net_income_estimate.rolling(trailing).mean()
-            eps_estimate = eps_estimate.rolling(trailing).mean()
+            net_income = self._get_trailing_data('Net Income', trailing, 'mean', freq)
+            eps = self._get_trailing_data('Basic EPS', trailing, 'mean', freq)
+            net_income_estimate = self._get_trailing_data('Net Income Estimate', trailing, 'mean', freq)
+            eps_estimate = self._get_trailing_data('EPS Estimate', trailing, 'mean', freq)
 
         result = earnings_model.get_shares_outstanding_vs_estimate(
             net_income, eps, net_income_estimate, eps_estimate
@@ -1952,14 +2081,14 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                fcf = fcf.freq.FY(exchange=self._exchange)
+                fcf = self._get_frequency_data('Free Cash Flow', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                fcf = fcf.freq.TTM
+                fcf = self._get_frequency_data('Free Cash Flow', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            fcf = fcf.rolling(trailing).mean()
+            fcf = self._get_trailing_data('Free Cash Flow', trailing, 'mean', freq)
 
         result = earnings_model.get_free_cash_flow_average_growth(fcf)
 
@@ -1978,6 +2107,7 @@ class Ratios:
     ################ Quality Model Ratios ###############
 
     @handle_errors
+    @_cache_collected
     def collect_quality_ratios(
             self,
             rounding: int | None = None,
@@ -2055,23 +2185,23 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                net_income = net_income.freq.FY(exchange=self._exchange)
-                total_assets = total_assets.freq.FY(exchange=self._exchange)
-                total_liabilities = total_liabilities.freq.FY(exchange=self._exchange)
-                dividend_paid = dividend_paid.freq.FY(exchange=self._exchange)
+                net_income = self._get_frequency_data('Net Income', FrequencyType.FY)
+                total_assets = self._get_frequency_data('Total Assets', FrequencyType.FY)
+                total_liabilities = self._get_frequency_data('Total Liabilities', FrequencyType.FY)
+                dividend_paid = self._get_frequency_data('Dividends Paid', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                net_income = net_income.freq.TTM
-                total_assets = total_assets.freq.TTM
-                total_liabilities = total_liabilities.freq.TTM
-                dividend_paid = dividend_paid.freq.TTM
+                net_income = self._get_frequency_data('Net Income', FrequencyType.TTM)
+                total_assets = self._get_frequency_data('Total Assets', FrequencyType.TTM)
+                total_liabilities = self._get_frequency_data('Total Liabilities', FrequencyType.TTM)
+                dividend_paid = self._get_frequency_data('Dividends Paid', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            net_income = net_income.rolling(trailing).mean()
-            total_assets = total_assets.rolling(trailing).mean()
-            total_liabilities = total_liabilities.rolling(trailing).mean()
-            dividend_paid = dividend_paid.rolling(trailing).mean()
+            net_income = self._get_trailing_data('Net Income', trailing, 'mean', freq)
+            total_assets = self._get_trailing_data('Total Assets', trailing, 'mean', freq)
+            total_liabilities = self._get_trailing_data('Total Liabilities', trailing, 'mean', freq)
+            dividend_paid = self._get_trailing_data('Dividends Paid', trailing, 'mean', freq)
 
         result = quality_model.get_intrinsic_compounding_rate(net_income, total_assets, total_liabilities,
                                                               dividend_paid)
@@ -2121,14 +2251,14 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                net_profit = net_profit.freq.FY(exchange=self._exchange)
+                net_profit = self._get_frequency_data('Net Income', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                net_profit = net_profit.freq.TTM
+                net_profit = self._get_frequency_data('Net Income', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            net_profit = net_profit.rolling(trailing).mean()
+            net_profit = self._get_trailing_data('Net Income', trailing, 'mean', freq)
 
         result = quality_model.get_dips_in_profit_over_10yrs(net_profit)
 
@@ -2183,17 +2313,17 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                invested_capital = invested_capital.freq.FY(exchange=self._exchange)
-                ebit = ebit.freq.FY(exchange=self._exchange)
+                invested_capital = self._get_frequency_data('Invested Capital', FrequencyType.FY)
+                ebit = self._get_frequency_data('EBIT', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                invested_capital = invested_capital.freq.TTM
-                ebit = ebit.freq.TTM
+                invested_capital = self._get_frequency_data('Invested Capital', FrequencyType.TTM)
+                ebit = self._get_frequency_data('EBIT', FrequencyType.TTM)
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            invested_capital = invested_capital.rolling(trailing).mean()
-            ebit = ebit.rolling(trailing).mean()
+            invested_capital = self._get_trailing_data('Invested Capital', trailing, 'mean', freq)
+            ebit = self._get_trailing_data('EBIT', trailing, 'mean', freq)
 
         result = quality_model.get_roic_band(invested_capital,ebit,tax_rate)
 
@@ -2237,13 +2367,13 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                cfo = cfo.freq.FY(exchange=self._exchange)
+                cfo = self._get_frequency_data('Operating Cash Flow', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                cfo = cfo.freq.TTM
+                cfo = self._get_frequency_data('Operating Cash Flow', FrequencyType.TTM)
 
         if trailing:
-            cfo = cfo.T.rolling(trailing).mean().T
+            cfo = self._get_trailing_data('Operating Cash Flow', trailing, 'mean', freq)
 
         result = quality_model.get_cfo_band(cfo)
 
@@ -2287,13 +2417,13 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                fcf = fcf.freq.FY(exchange=self._exchange)
+                fcf = self._get_frequency_data('Free Cash Flow', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                fcf = fcf.freq.TTM
+                fcf = self._get_frequency_data('Free Cash Flow', FrequencyType.TTM)
 
         if trailing:
-            fcf = fcf.T.rolling(trailing).mean().T
+            fcf = self._get_trailing_data('Free Cash Flow', trailing, 'mean', freq)
 
         result = quality_model.get_negative_dips_in_fcf_over_10yrs(fcf)
 
@@ -2337,13 +2467,13 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                fcf = fcf.freq.FY(exchange=self._exchange)
+                fcf = self._get_frequency_data('Free Cash Flow', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                fcf = fcf.freq.TTM
+                fcf = self._get_frequency_data('Free Cash Flow', FrequencyType.TTM)
 
         if trailing:
-            fcf = fcf.T.rolling(trailing).mean().T
+            fcf = self._get_trailing_data('Free Cash Flow', trailing, 'mean', freq)
 
         result = quality_model.get_negative_fcf_years(fcf)
 
@@ -2388,16 +2518,16 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                cfo = cfo.freq.FY(exchange=self._exchange)
-                net_profit = net_profit.freq.FY(exchange=self._exchange)
+                cfo = self._get_frequency_data('Operating Cash Flow', FrequencyType.FY)
+                net_profit = self._get_frequency_data('Net Income', FrequencyType.FY)
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                cfo = cfo.freq.TTM
-                net_profit = net_profit.freq.TTM
+                cfo = self._get_frequency_data('Operating Cash Flow', FrequencyType.TTM)
+                net_profit = self._get_frequency_data('Net Income', FrequencyType.TTM)
 
         if trailing:
-            cfo = cfo.T.rolling(trailing).mean().T
-            net_profit = net_profit.T.rolling(trailing).mean().T
+            cfo = self._get_trailing_data('Operating Cash Flow', trailing, 'mean', freq)
+            net_profit = self._get_trailing_data('Net Income', trailing, 'mean', freq)
 
         result = quality_model.get_cfo_to_net_profit(cfo, net_profit)
 
@@ -2417,6 +2547,7 @@ class Ratios:
 
 
     @handle_errors
+    @_cache_collected
     def collect_valuation_ratios(
             self,
             rounding: int | None = None,
@@ -2507,25 +2638,25 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                price = price.freq.FY(exchange=self._exchange)
-                wacc = wacc.freq.FY(exchange=self._exchange)
-                ebit = ebit.freq.FY(exchange=self._exchange)
-                tax_rate = tax_rate.freq.FY(exchange=self._exchange)
+                price = self._get_frequency_data('Stock Price', FrequencyType.FY)
+                wacc = self._get_frequency_data('WACC', FrequencyType.FY)
+                ebit = self._get_frequency_data('EBIT', FrequencyType.FY)
+                tax_rate = self._get_frequency_data('Tax Rate', FrequencyType.FY)
                 # Current price typically doesn't get frequency treatment
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                price = price.freq.TTM
-                wacc = wacc.freq.TTM
-                ebit = ebit.freq.TTM
-                tax_rate = tax_rate.freq.TTM
+                price = self._get_frequency_data('Stock Price', FrequencyType.TTM)
+                wacc = self._get_frequency_data('WACC', FrequencyType.TTM)
+                ebit = self._get_frequency_data('EBIT', FrequencyType.TTM)
+                tax_rate = self._get_frequency_data('Tax Rate', FrequencyType.TTM)
                 # Current price typically doesn't get frequency treatment
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            price = price.rolling(trailing).mean()
-            wacc = wacc.rolling(trailing).mean()
-            ebit = ebit.rolling(trailing).mean()
-            tax_rate = tax_rate.rolling(trailing).mean()
+            price = self._get_trailing_data('Stock Price', trailing, 'mean', freq)
+            wacc = self._get_trailing_data('WACC', trailing, 'mean', freq)
+            ebit = self._get_trailing_data('EBIT', trailing, 'mean', freq)
+            tax_rate = self._get_trailing_data('Tax Rate', trailing, 'mean', freq)
 
 
         result = valuation_model.get_steady_state_value(price, wacc, shares_outstanding, ebit, tax_rate)
@@ -2583,28 +2714,28 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                net_income = net_income.freq.FY(exchange=self._exchange)
-                total_assets = total_assets.freq.FY(exchange=self._exchange)
-                total_liabilities = total_liabilities.freq.FY(exchange=self._exchange)
-                eps = eps.freq.FY(exchange=self._exchange)
-                dividends_paid = dividends_paid.freq.FY(exchange=self._exchange)
+                net_income = self._get_frequency_data('Net Income', FrequencyType.FY)
+                total_assets = self._get_frequency_data('Total Assets', FrequencyType.FY)
+                total_liabilities = self._get_frequency_data('Total Liabilities', FrequencyType.FY)
+                eps = self._get_frequency_data('Basic EPS', FrequencyType.FY)
+                dividends_paid = self._get_frequency_data('Dividends Paid', FrequencyType.FY)
                 # Stock price typically doesn't get frequency treatment
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                net_income = net_income.freq.TTM
-                total_assets = total_assets.freq.TTM
-                total_liabilities = total_liabilities.freq.TTM
-                eps = eps.freq.TTM
-                dividends_paid = dividends_paid.freq.TTM
+                net_income = self._get_frequency_data('Net Income', FrequencyType.TTM)
+                total_assets = self._get_frequency_data('Total Assets', FrequencyType.TTM)
+                total_liabilities = self._get_frequency_data('Total Liabilities', FrequencyType.TTM)
+                eps = self._get_frequency_data('Basic EPS', FrequencyType.TTM)
+                dividends_paid = self._get_frequency_data('Dividends Paid', FrequencyType.TTM)
                 # Stock price typically doesn't get frequency treatment
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            net_income = net_income.rolling(trailing).mean()
-            total_assets = total_assets.rolling(trailing).mean()
-            total_liabilities = total_liabilities.rolling(trailing).mean()
-            eps = eps.rolling(trailing).mean()
-            dividends_paid = dividends_paid.rolling(trailing).mean()
+            net_income = self._get_trailing_data('Net Income', trailing, 'mean', freq)
+            total_assets = self._get_trailing_data('Total Assets', trailing, 'mean', freq)
+            total_liabilities = self._get_trailing_data('Total Liabilities', trailing, 'mean', freq)
+            eps = self._get_trailing_data('Basic EPS', trailing, 'mean', freq)
+            dividends_paid = self._get_trailing_data('Dividends Paid', trailing, 'mean', freq)
 
         result = valuation_model.get_fair_value_vs_market_price(
             net_income, total_assets, total_liabilities, eps, current_price, dividends_paid
@@ -2665,17 +2796,17 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                revenue = revenue.freq.FY(exchange=self._exchange)
+                revenue = self._get_frequency_data('Revenue', FrequencyType.FY)
                 # Stock price typically doesn't get frequency treatment
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                revenue = revenue.freq.TTM
+                revenue = self._get_frequency_data('Revenue', FrequencyType.TTM)
                 # Stock price typically doesn't get frequency treatment
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            price = price.rolling(trailing).mean()
-            revenue = revenue.rolling(trailing).mean()
+            price = self._get_trailing_data('Stock Price', trailing, 'mean')
+            revenue = self._get_trailing_data('Revenue', trailing, 'mean', freq)
 
         result = valuation_model.get_price_to_revenue_band(price, revenue, shares_outstanding)
 
@@ -2730,17 +2861,17 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                eps = eps.freq.FY(exchange=self._exchange)
+                eps = self._get_frequency_data('Basic EPS', FrequencyType.FY)
                 # Stock price typically doesn't get frequency treatment
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                eps = eps.freq.TTM
+                eps = self._get_frequency_data('Basic EPS', FrequencyType.TTM)
                 # Stock price typically doesn't get frequency treatment
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            price = price.rolling(trailing).mean()
-            eps = eps.rolling(trailing).mean()
+            price = self._get_trailing_data('Stock Price', trailing, 'mean')
+            eps = self._get_trailing_data('Basic EPS', trailing, 'mean', freq)
 
         result = valuation_model.get_price_to_eps_band(price, eps)
 
@@ -2799,17 +2930,17 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                cfo = cfo.freq.FY(exchange=self._exchange)
+                cfo = self._get_frequency_data('Operating Cash Flow', FrequencyType.FY)
                 # Stock price typically doesn't get frequency treatment
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                cfo = cfo.freq.TTM
+                cfo = self._get_frequency_data('Operating Cash Flow', FrequencyType.TTM)
                 # Stock price typically doesn't get frequency treatment
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            price = price.rolling(trailing).mean()
-            cfo = cfo.rolling(trailing).mean()
+            price = self._get_trailing_data('Stock Price', trailing, 'mean')
+            cfo = self._get_trailing_data('Operating Cash Flow', trailing, 'mean', freq)
 
         result = valuation_model.get_price_to_cfo_band(price, cfo, shares_outstanding)
 
@@ -2869,18 +3000,18 @@ class Ratios:
         if freq is not None:
             if freq == FrequencyType.FY:
                 # Apply fiscal year calculations
-                fcf = fcf.freq.FY(exchange=self._exchange)
+                fcf = self._get_frequency_data('Free Cash Flow', FrequencyType.FY)
                 # Stock price typically doesn't get frequency treatment
             elif freq == FrequencyType.TTM:
                 # Apply trailing twelve months calculations
-                fcf = fcf.freq.TTM
+                fcf = self._get_frequency_data('Free Cash Flow', FrequencyType.TTM)
                 # Stock price typically doesn't get frequency treatment
 
 
         # Apply trailing if specified (for backward compatibility)
         if trailing:
-            fcf = fcf.rolling(trailing).mean()
-            price = price.rolling(trailing).mean()
+            fcf = self._get_trailing_data('Free Cash Flow', trailing, 'mean', freq)
+            price = self._get_trailing_data('Stock Price', trailing, 'mean')
 
         result = valuation_model.get_fcf_yield(fcf, price, shares_outstanding)
         
@@ -2897,7 +3028,66 @@ class Ratios:
         return self._process_ratio_result(result_df, growth, lag, rounding)
 
 
-
-
-
-
+def collect_ratios_by_ticker(
+    financial_data: dict[str, pd.DataFrame],
+    exchange: str,
+    quarterly: bool = False,
+    rounding: int | None = 4,
+    max_workers: int | None = None,
+    float32: bool = False,
+) -> dict[str, pd.DataFrame]:
+    """
+    Calculates and collects all ratios for several tickers in parallel.
+
+    The ratios of each ticker are independent, so every ticker is computed in its own
+    worker process. When used in a script, call this from under an
+    ``if __name__ == "__main__":`` guard so the worker processes can be spawned safely.
+
+    Args:
+        financial_data (dict[str, pd.DataFrame]): Financial data per ticker, with the
+            same columns as expected by the Ratios class.
+        exchange (str): The exchange the tickers are listed on.
+        quarterly (bool, optional): Whether to use quarterly data. Defaults to False.
+        rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+        max_workers (int, optional): The maximum number of worker processes. Defaults to
+            the number of processors on the machine. With a single worker or ticker the
+            ratios are calculated in the current process.
+        float32 (bool, optional): Whether to downcast the financial data to float32, see the
+            Ratios class. Defaults to False.
+
+    Returns:
+        dict[str, pd.DataFrame]: All financial health, earning, quality and valuation
+            ratios per ticker.
+    """
+    arguments = [
+        (ticker, data, exchange, quarterly, rounding, float32) for ticker, data in financial_data.items()
+    ]
+
+    if max_workers == 1 or len(arguments) <= 1:
+        return {args[0]: _collect_ticker_ratios(*args) for args in arguments}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_collect_ticker_ratios, *zip(*arguments))
+        return dict(zip(financial_data, results))
+
+
+def _collect_ticker_ratios(
+    ticker: str,
+    financial_data: pd.DataFrame,
+    exchange: str,
+    quarterly: bool,
+    rounding: int | None,
+    float32: bool,
+) -> pd.DataFrame:
+    """Calculates all ratios of a single ticker, used as the worker of collect_ratios_by_ticker."""
+    ratios = Ratios(ticker, exchange, financial_data, quarterly=quarterly, rounding=rounding, float32=float32)
+
+    return pd.concat(
+        [
+            ratios.collect_financial_health_ratios(),
+            ratios.collect_earning_ratios(),
+            ratios.collect_quality_ratios(),
+            ratios.collect_valuation_ratios(),
+        ],
+        axis=1,
+    )
@@ -3,6 +3,7 @@ import pytest
 
 from financial_ratios.earnings_model import (
     get_piotroski_score,
+    get_piotroski_score_batch,
     get_revenue_growth,
     get_eps_growth,
     get_revenue_consecutive_growth,
@@ -118,6 +119,41 @@ def test_piotroski_score(sample_data):
     assert all(float(score).is_integer() for score in valid_scores)
 
 
+def test_piotroski_score_batch(sample_data):
+    """Test the batched F-Score matches the per-ticker calculation for every column."""
+    names = [
+        'net_income', 'total_assets', 'cash_flow_from_operations', 'current_assets',
+        'current_liabilities', 'long_term_debt', 'shares_outstanding', 'revenue', 'cogs'
+    ]
+    data = {
+        name: pd.DataFrame({'A': sample_data[name], 'B': sample_data[name] * 2})
+        for name in names
+    }
+    data['net_income']['B'] = sample_data['net_income'][::-1].to_numpy()
+
+    result = get_piotroski_score_batch(data)
+
+    assert list(result.columns) == ['A', 'B']
+    assert (result.dtypes == 'Int64').all()
+    for ticker in result.columns:
+        expected = get_piotroski_score(*(data[name][ticker] for name in names))
+        pd.testing.assert_series_equal(result[ticker], expected, check_names=False)
+
+
+def test_piotroski_score_float32(sample_data):
+    """Test float32 inputs give the same F-Score as float64 inputs."""
+    names = [
+        'net_income', 'total_assets', 'cash_flow_from_operations', 'current_assets',
+        'current_liabilities', 'long_term_debt', 'shares_outstanding', 'revenue', 'cogs'
+    ]
+
+    result = get_piotroski_score(*(sample_data[name].astype('float32') for name in names))
+
+    pd.testing.assert_series_equal(
+        result, get_piotroski_score(*(sample_data[name].astype('float64') for name in names))
+    )
+
+
 def test_revenue_growth(sample_data):
     """Test revenue growth calculation including edge cases."""
     result = get_revenue_growth(sample_data['revenue'])
@@ -446,6 +482,16 @@ def test_roa_vs_average_roa(sample_data):
     assert result[3] == pytest.approx(expected_ratio)
 
 
+def test_roa_vs_average_roa_infinite(time_index):
+    """Test an infinite ROA gives NaN rather than an infinite ratio."""
+    net_income = pd.Series([100, float('inf'), 90, 110], index=time_index)
+    total_assets = pd.Series([1000, 1000, 900, 950], index=time_index)
+
+    result = get_roa_vs_average_roa(net_income, total_assets)
+
+    assert pd.isna(result[1])
+
+
 def test_revenue_vs_estimate(sample_data):
     """Test revenue vs estimate calculation including edge cases."""
     result = get_revenue_vs_estimate(sample_data['revenue'], sample_data['revenue_estimate'])
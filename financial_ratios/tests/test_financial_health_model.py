@@ -6,7 +6,8 @@ from financial_ratios.financial_health_model import (
     get_interest_coverage_ratio,
     get_current_ratio,
     get_cash_conversion_cycle,
-    get_altman_z_score
+    get_altman_z_score,
+    get_altman_z_score_batch
 )
 
 # Test Data Setup
@@ -55,6 +56,17 @@ def test_debt_to_equity_ratio(sample_data):
     # Negative equity - should still compute but indicates financial distress
     assert result.iloc[3] == pytest.approx(-9.0)  # 900/-100
 
+
+def test_debt_to_equity_ratio_infinite(time_index):
+    """Test infinite debt to equity ratios are returned as NaN."""
+    total_debt = pd.Series([np.inf, -np.inf, 500, np.nan], index=time_index)
+    total_equity = pd.Series([1000, 1000, 1e-310, 1000], index=time_index)
+
+    result = get_debt_to_equity_ratio(total_debt, total_equity)
+
+    assert result.isna().all()
+
+
 def test_interest_coverage_ratio(sample_data):
     """Test interest coverage ratio calculation including edge cases."""
     result = get_interest_coverage_ratio(
@@ -151,4 +163,85 @@ def test_altman_z_score(sample_data):
     x4 = 0.6 * ((18 * 100) / 350)
     x5 = 1.0 * (800 / 2500)
     expected_z = x1 + x2 + x3 + x4 + x5
-    assert result.iloc[2] == pytest.approx(expected_z)
\ No newline at end of file
+    assert result.iloc[2] == pytest.approx(expected_z)
+
+
+def test_altman_z_score_unaligned_inputs(sample_data):
+    """Test Altman Z-Score aligns inputs on the union of their indexes."""
+    stock_price = sample_data['stock_price'].iloc[::2]
+    result = get_altman_z_score(
+        sample_data['current_assets'],
+        sample_data['current_liabilities'],
+        sample_data['total_assets'],
+        sample_data['ebit'],
+        sample_data['diluted_shares_outstanding'],
+        sample_data['revenue'],
+        sample_data['total_liabilities'],
+        sample_data['retained_earnings'],
+        stock_price
+    )
+
+    assert result.index.equals(sample_data['stock_price'].index)
+    assert pd.notna(result.iloc[2])
+
+    # Periods without a stock price have no market value of equity
+    assert pd.isna(result.iloc[3])
+
+def test_altman_z_score_batch(sample_data):
+    """Test the batched Z-Score matches the per-ticker calculation for every column."""
+    names = [
+        'current_assets', 'current_liabilities', 'total_assets', 'ebit',
+        'diluted_shares_outstanding', 'revenue', 'total_liabilities',
+        'retained_earnings', 'stock_price'
+    ]
+    data = {
+        name: pd.DataFrame({'A': sample_data[name], 'B': sample_data[name][::-1].to_numpy()},
+                           index=sample_data[name].index)
+        for name in names
+    }
+
+    result = get_altman_z_score_batch(data)
+
+    assert list(result.columns) == ['A', 'B']
+    for ticker in result.columns:
+        expected = get_altman_z_score(*(data[name][ticker] for name in names))
+        pd.testing.assert_series_equal(result[ticker], expected, check_names=False)
+
+def test_current_ratio_frame(sample_data):
+    """Test the current ratio divides (periods x tickers) frames column by column."""
+    current_assets = pd.DataFrame({'A': sample_data['current_assets'], 'B': sample_data['current_assets'] * 2})
+    current_liabilities = pd.DataFrame({'A': sample_data['current_liabilities'], 'B': sample_data['current_liabilities']})
+
+    result = get_current_ratio(current_assets, current_liabilities)
+
+    assert isinstance(result, pd.DataFrame)
+    assert result['A'].iloc[0] == pytest.approx(2.0)
+    assert result['B'].iloc[0] == pytest.approx(4.0)
+    assert result.iloc[1].isna().all()
+
+def test_altman_z_score_leaves_inputs_unchanged(sample_data):
+    """Test the in-place accumulation of the Z-Score never writes into its inputs."""
+    names = [
+        'current_assets', 'current_liabilities', 'total_assets', 'ebit',
+        'diluted_shares_outstanding', 'revenue', 'total_liabilities',
+        'retained_earnings', 'stock_price'
+    ]
+    inputs = [sample_data[name].astype(float) for name in names]
+    originals = [series.copy() for series in inputs]
+
+    result = get_altman_z_score(*inputs)
+
+    for series, original in zip(inputs, originals):
+        pd.testing.assert_series_equal(series, original)
+        assert not np.shares_memory(result.to_numpy(), series.to_numpy())
+
+def test_cash_conversion_cycle_frame(sample_data):
+    """Test cash conversion cycle on (periods x tickers) frames matches the per-series result."""
+    names = ['inventory', 'cogs', 'accounts_receivable', 'revenue', 'accounts_payable']
+    frames = [pd.DataFrame({'A': sample_data[name], 'B': sample_data[name] * 2}) for name in names]
+
+    result = get_cash_conversion_cycle(*frames)
+    expected = get_cash_conversion_cycle(*(sample_data[name] for name in names))
+
+    pd.testing.assert_series_equal(result['A'], expected, check_names=False)
+    pd.testing.assert_series_equal(result['B'], expected, check_names=False)
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from financial_ratios.utils.helpers import (
+    calculate_rolling_count,
+    get_consecutive_number_of_growth,
+    safe_divide,
+    safe_divide_by,
+)
+
+
+def test_rolling_count_matches_rolling_sum():
+    """Test the trailing count equals a rolling sum of the condition."""
+    condition = pd.Series([True, False, True, True, False, True, True])
+    expected = condition.astype(int).rolling(window=3, min_periods=1).sum()
+
+    pd.testing.assert_series_equal(calculate_rolling_count(condition, window=3), expected)
+
+
+def test_rolling_count_nullable_condition():
+    """Test missing values in a nullable boolean condition count as False."""
+    values = pd.Series([1.0, -2.0, pd.NA, -1.0, 3.0], dtype='Float64')
+    result = calculate_rolling_count(values < 0, window=2)
+
+    np.testing.assert_array_equal(result.to_numpy(), [0.0, 1.0, 1.0, 1.0, 1.0])
+
+
+def test_safe_divide_masks_only_zero_denominators():
+    """Test zero denominators give NaN while infinite ones divide as usual."""
+    numerator = pd.Series([1.0, 2.0, np.inf, 3.0])
+    denominator = pd.Series([0.0, np.inf, np.inf, -np.inf])
+    expected = numerator / denominator.replace(0, np.nan)
+
+    pd.testing.assert_series_equal(safe_divide(numerator, denominator), expected)
+    np.testing.assert_array_equal(
+        safe_divide(numerator.to_numpy(), denominator.to_numpy()), expected.to_numpy()
+    )
+
+
+def test_safe_divide_by_matches_safe_divide():
+    """Test dividing by a shared denominator matches safe_divide and keeps float32."""
+    denominator = np.array([0.0, 2.0, np.inf, 4.0], dtype=np.float32)
+    per_denominator = safe_divide_by(denominator)
+
+    for numerator in (np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float32), np.array([1, 2, 3, 4])):
+        result = per_denominator(numerator)
+        np.testing.assert_array_equal(result, safe_divide(numerator, denominator))
+        assert result.dtype == safe_divide(numerator, denominator).dtype
+
+
+def test_consecutive_growth_nullable():
+    """Test missing values in nullable data break the growth streak like NaN does."""
+    values = pd.Series([100, 110, 120, pd.NA, 130, 140], dtype='Int64')
+    result = get_consecutive_number_of_growth(values)
+
+    pd.testing.assert_series_equal(result, get_consecutive_number_of_growth(values.astype(float)))
+    np.testing.assert_array_equal(result.to_numpy(), [np.nan, 0.0, 1.0, 2.0, 2.0, 2.0])
@@ -0,0 +1,22 @@
+import importlib.util
+
+import financial_ratios
+
+
+def test_all_is_unique():
+    """Test the package exports every name exactly once."""
+    assert len(set(financial_ratios.__all__)) == len(financial_ratios.__all__)
+
+
+def test_all_names_resolve():
+    """Test every exported name can be accessed, including the lazily imported ones."""
+    for name in financial_ratios.__all__:
+        assert getattr(financial_ratios, name) is not None
+
+
+def test_single_package_init():
+    """Test the package is loaded from a single __init__.py."""
+    spec = importlib.util.find_spec('financial_ratios')
+
+    assert spec.origin == financial_ratios.__file__
+    assert len(spec.submodule_search_locations) == 1
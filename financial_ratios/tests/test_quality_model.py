@@ -8,7 +8,7 @@ from financial_ratios.quality_model import (
     get_cfo_band,
     get_negative_dips_in_fcf_over_10yrs,
     get_negative_fcf_years,
-    get_fcf_to_net_profit_band
+    get_cfo_to_net_profit
 )
 
 # Test Data Setup
@@ -72,6 +72,19 @@ def test_dips_in_profit_over_10yrs(sample_data):
         assert isinstance(result[i], (int, float, np.integer))
         assert result[i] >= 0  # Count should be non-negative
 
+
+def test_dips_in_profit_over_10yrs_nullable(time_index):
+    """Test missing values in nullable profits are carried over like NaN."""
+    net_profit = pd.Series(
+        [100, 80, pd.NA, 60, 70, 50, 55, 45, 50, 40, 45, 35], dtype='Float64', index=time_index
+    )
+
+    result = get_dips_in_profit_over_10yrs(net_profit)
+
+    pd.testing.assert_series_equal(result, get_dips_in_profit_over_10yrs(net_profit.astype(float)))
+    assert result.iloc[3] == 2  # 100 -> 80, then 80 (carried over) -> 60
+
+
 def test_roic_band(sample_data):
     """Test ROIC band calculation including edge cases."""
     result = get_roic_band(
@@ -132,9 +145,23 @@ def test_negative_fcf_years(sample_data):
         assert isinstance(result[i], (int, float, np.integer))
         assert result[i] >= 0  # Count should be non-negative
 
+
+def test_fcf_counts_nullable(time_index):
+    """Test missing values in nullable FCF never count as dips or negative years."""
+    fcf = pd.Series(
+        [130, -140, pd.NA, 135, 150, -155, 152, 160, 165, 170, 168, 175], dtype='Float64', index=time_index
+    )
+
+    for func in (get_negative_dips_in_fcf_over_10yrs, get_negative_fcf_years):
+        result = func(fcf)
+        pd.testing.assert_series_equal(result, func(fcf.astype(float)))
+
+    assert get_negative_fcf_years(fcf).iloc[5] == 2
+
+
 def test_fcf_to_net_profit_band(sample_data):
     """Test FCF to net profit band calculation including edge cases."""
-    result = get_fcf_to_net_profit_band(
+    result = get_cfo_to_net_profit(
         sample_data['fcf'],
         sample_data['net_profit']
     )
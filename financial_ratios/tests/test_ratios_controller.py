@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+
+from financial_ratios.ratios_controller import Ratios
+
+
+# Test Data Setup
+@pytest.fixture
+def financial_data():
+    index = pd.date_range(start='2020-03-31', periods=6, freq='QE')
+    return pd.DataFrame({
+        'Total Debt': [100.0, 110.0, 120.0, 130.0, 140.0, 150.0],
+        'Total Equity': [200.0, 210.0, 220.0, 230.0, 240.0, 250.0],
+    }, index=index)
+
+
+def test_input_data_changes_ignored(financial_data):
+    """Test changing the caller's DataFrame after construction does not affect the ratios."""
+    ratios = Ratios('TEST', 'NSE', financial_data, quarterly=True)
+    reference = Ratios('TEST', 'NSE', financial_data.copy(), quarterly=True)
+    trailing = ratios.get_debt_to_equity_ratio(trailing=2)
+
+    financial_data['Total Debt'] *= 2
+
+    # Both the cached trailing data and the uncached columns still reflect the original data
+    pd.testing.assert_frame_equal(ratios.get_debt_to_equity_ratio(trailing=2), trailing)
+    pd.testing.assert_frame_equal(
+        ratios.get_debt_to_equity_ratio(), reference.get_debt_to_equity_ratio()
+    )
+
+
+def test_collected_ratios_match_getters(financial_data):
+    """Test cached collected ratios stay in line with the getters when the caller's DataFrame changes."""
+    financial_data['EBIT'] = [50.0, 55.0, 60.0, 65.0, 70.0, 75.0]
+    financial_data['Interest Expense'] = [5.0, 5.0, 6.0, 6.0, 7.0, 7.0]
+
+    ratios = Ratios('TEST', 'NSE', financial_data, quarterly=True)
+    reference = Ratios('TEST', 'NSE', financial_data.copy(), quarterly=True)
+    ratios.collect_financial_health_ratios()
+
+    financial_data['EBIT'] *= 2
+
+    # Both the cached collected ratios and a recalculated getter match an instance built before the change
+    pd.testing.assert_frame_equal(
+        ratios.collect_financial_health_ratios(), reference.collect_financial_health_ratios()
+    )
+    pd.testing.assert_frame_equal(
+        ratios.get_interest_coverage_ratio(), reference.get_interest_coverage_ratio()
+    )
+
+
+def test_nullable_quality_ratios():
+    """Test counting ratios on nullable data match the float64 results, growth included."""
+    index = pd.date_range(start='2020-03-31', periods=6, freq='QE')
+    fcf = pd.Series([130, -140, pd.NA, 135, -150, 155], dtype='Float64', index=index)
+
+    ratios = Ratios('TEST', 'NSE', pd.DataFrame({'Free Cash Flow': fcf}), quarterly=True)
+    reference = Ratios('TEST', 'NSE', pd.DataFrame({'Free Cash Flow': fcf.astype(float)}), quarterly=True)
+
+    for method in ('get_fcf_dip_ratio', 'get_negative_fcf_ratio'):
+        for growth in (False, True):
+            pd.testing.assert_frame_equal(
+                getattr(ratios, method)(growth=growth), getattr(reference, method)(growth=growth)
+            )
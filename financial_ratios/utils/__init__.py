@@ -4,7 +4,7 @@ Utilities for Financial Ratios
 This package provides utility functions and helpers for financial ratio calculations.
 """
 
-from .helpers import calculate_growth, handle_errors, calculate_average
+from .helpers import calculate_growth, handle_errors, calculate_average, calculate_rolling_count, mask_infinite, safe_divide, safe_divide_by, aligned_values
 from .ratio_dependencies import (
     get_ratio_dependencies,
     get_all_financial_dependencies,
@@ -17,6 +17,11 @@ __all__ = [
     'calculate_growth',
     'handle_errors',
     'calculate_average',
+    'calculate_rolling_count',
+    'mask_infinite',
+    'safe_divide',
+    'safe_divide_by',
+    'aligned_values',
     'get_ratio_dependencies',
     'get_all_financial_dependencies',
     'get_dependencies_for_categories',
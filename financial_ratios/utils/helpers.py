@@ -3,7 +3,6 @@
 import inspect
 import time
 import pandas as pd
-import warnings
 from datetime import datetime
 from enum import Enum, auto
 from functools import wraps
@@ -36,8 +35,6 @@ def calculate_growth(
     Returns:
         pd.Series | pd.DataFrame: Growth values.
     """
-    warnings.simplefilter(action="ignore", category=FutureWarning)
-
     def abs_pct_change(x, periods=1):
         prev = x.shift(periods)
         return (x - prev) / prev.abs()
@@ -45,31 +42,87 @@ def calculate_growth(
     if isinstance(dataset, pd.Series):
         if isinstance(lag, list):
             return pd.concat(
-                [abs_pct_change(dataset, l).round(rounding).rename(f"Lag {l}") for l in lag],
+                [_series_growth(dataset, l, rounding).rename(f"Lag {l}") for l in lag],
                 axis=1
             )
-        return abs_pct_change(dataset, lag).round(rounding)
+        return _series_growth(dataset, lag, rounding)
 
     if isinstance(lag, list):
         result = {}
         for l in lag:
             if axis == 1:
-                growth = dataset.T.pipe(abs_pct_change, periods=l).T
+                result[f"Lag {l}"] = dataset.T.pipe(abs_pct_change, periods=l).T.round(rounding)
             else:
-                growth = dataset.pipe(abs_pct_change, periods=l)
-            result[f"Lag {l}"] = growth.round(rounding)
+                result[f"Lag {l}"] = _frame_growth(dataset, l, rounding)
         return pd.concat(result, axis=1)
 
     # Single lag
     if axis == 1:
         return dataset.T.pipe(abs_pct_change, periods=lag).T.round(rounding)
     else:
-        return dataset.pipe(abs_pct_change, periods=lag).round(rounding)
+        return _frame_growth(dataset, lag, rounding)
+
+
+
+def _series_growth(series: pd.Series, lag: int, rounding: int | None) -> pd.Series:
+    """
+    Directional growth of a single Series, computed on the underlying array.
+
+    Plain integer and float data skip the pandas shift/align machinery; extension and
+    object dtypes keep the pandas arithmetic so their missing value semantics are kept.
+    """
+    if not _is_numpy_numeric(series.dtype):
+        prev = series.shift(lag)
+        return ((series - prev) / prev.abs()).round(rounding)
+
+    dtype = series.dtype if series.dtype.kind == "f" else np.float64
+    growth = _array_growth(series.to_numpy(dtype=dtype), lag, rounding)
+
+    return pd.Series(growth, index=series.index, name=series.name)
+
+
+def _frame_growth(frame: pd.DataFrame, lag: int, rounding: int | None) -> pd.DataFrame:
+    """
+    Directional growth of every column of a DataFrame along its index.
+
+    Frames of a single plain integer or float dtype are computed on one 2-D array;
+    mixed and extension dtypes keep the column-wise pandas arithmetic.
+    """
+    dtypes = set(frame.dtypes)
+    if len(dtypes) != 1 or not _is_numpy_numeric(dtype := dtypes.pop()):
+        prev = frame.shift(lag)
+        return ((frame - prev) / prev.abs()).round(rounding)
 
+    values = frame.to_numpy(dtype=dtype if dtype.kind == "f" else np.float64)
+    growth = _array_growth(values, lag, rounding)
+
+    return pd.DataFrame(growth, index=frame.index, columns=frame.columns)
+
+
+def _array_growth(values: np.ndarray, lag: int, rounding: int | None) -> np.ndarray:
+    """Directional growth along the first axis of a float array, (value - prev) / |prev|."""
+    prev = np.full_like(values, np.nan)
+    if lag > 0:
+        prev[lag:] = values[:-lag]
+    elif lag < 0:
+        prev[:lag] = values[-lag:]
+    else:
+        prev[:] = values
+
+    # Reuse the difference and the shifted array as outputs instead of allocating per step
+    growth = np.subtract(values, prev)
+    np.abs(prev, out=prev)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(growth, prev, out=growth)
+
+    if rounding is not None:
+        np.round(growth, rounding, out=growth)
+
+    return growth
 
 
 def calculate_average(
-    dataset: pd.Series,
+    dataset: pd.Series | pd.DataFrame,
     growth: bool = False,
     trailing: int | None = 20,
     min_periods: int | None = 1,
@@ -79,7 +132,8 @@ def calculate_average(
     Calculate the average growth over a trailing period for any financial metric.
     
     Args:
-        dataset (pd.Series): The time series data to calculate growth for
+        dataset (pd.Series | pd.DataFrame): The time series data to calculate growth for.
+            A DataFrame is averaged column-wise in a single rolling pass.
         growth: (bool) , growth should be calculated or not. Defaults to False.
         trailing (int, optional): Number of periods to calculate the trailing average over. 
             Defaults to 20.
@@ -93,50 +147,268 @@ def calculate_average(
     if growth:
         # Calculate period-over-period growth
         dataset = calculate_growth(dataset, axis=0)
-        # handle infinite values by replacing with NaN
-        dataset = dataset.replace([float('inf'), float('-inf')], pd.NA)
         # convert the dataset, coercing invalid values like <NA> or 'NaN' into actual np.nan.
-        dataset = pd.to_numeric(dataset, errors='coerce')
+        # Growth of plain numeric data is already float, so the conversion can be skipped.
+        if isinstance(dataset, pd.DataFrame):
+            if not all(_is_numpy_numeric(dtype) for dtype in dataset.dtypes):
+                dataset = dataset.apply(pd.to_numeric, errors='coerce')
+        elif not _is_numpy_numeric(dataset.dtype):
+            dataset = pd.to_numeric(dataset, errors='coerce')
+        # handle infinite values by replacing with NaN
+        dataset = mask_infinite(dataset)
 
     # Calculate trailing average of growth rates
     if trailing:
         result = dataset.rolling(window=trailing, min_periods=min_periods).mean()
+        # rolling always returns float64, keep the precision of the input (e.g. float32)
+        if isinstance(dataset, pd.Series) and dataset.dtype == np.float32:
+            result = result.astype(np.float32)
     else:
         result = dataset
         
     return result.round(rounding)
 
+
+def mask_infinite(dataset: pd.Series | pd.DataFrame, zero: bool = False) -> pd.Series | pd.DataFrame:
+    """
+    Replace infinite values, and optionally zeros, with NaN.
+
+    Unlike ``dataset.replace([np.inf, -np.inf], np.nan)`` the data is only copied when
+    it actually contains values to mask; otherwise the input is returned as is.
+
+    Args:
+        dataset (pd.Series | pd.DataFrame): Input data.
+        zero (bool): Whether to mask zeros as well. Defaults to False.
+
+    Returns:
+        pd.Series | pd.DataFrame: The data without infinite values (and zeros).
+    """
+    values = dataset.to_numpy()
+    try:
+        invalid = np.isinf(values)
+    except TypeError:
+        # Object and extension dtypes
+        targets = [np.inf, -np.inf, 0] if zero else [np.inf, -np.inf]
+        invalid = dataset.isin(targets).to_numpy()
+    else:
+        if zero:
+            invalid |= values == 0
+
+    if not invalid.any():
+        return dataset
+
+    if isinstance(dataset, pd.Series) and dataset.dtype.kind == "f":
+        # Masking the array directly avoids the much slower Series.mask
+        masked = values.copy()
+        masked[invalid] = np.nan
+        return pd.Series(masked, index=dataset.index, name=dataset.name)
+
+    return dataset.mask(invalid)
+
+
+def safe_divide(
+    numerator: pd.Series | pd.DataFrame | np.ndarray,
+    denominator: pd.Series | pd.DataFrame | np.ndarray,
+) -> pd.Series | pd.DataFrame | np.ndarray:
+    """
+    Divide element-wise, returning NaN wherever the denominator is zero.
+
+    Replaces the ``numerator / denominator.replace(0, np.nan)`` pattern with a single
+    masked division, so the denominator is never copied. Series and DataFrames are
+    aligned like regular pandas arithmetic, so 2-D (periods x tickers) frames can be
+    divided in one call. Infinite denominators are divided by as usual, so a finite
+    numerator over an infinite denominator gives 0; mask them first where that is
+    not wanted.
+
+    Args:
+        numerator (pd.Series | pd.DataFrame | np.ndarray): Values to divide.
+        denominator (pd.Series | pd.DataFrame | np.ndarray): Values to divide by.
+
+    Returns:
+        pd.Series | pd.DataFrame | np.ndarray: The quotient, a pandas object if either
+            input is one.
+    """
+    numerator_is_pandas = isinstance(numerator, (pd.Series, pd.DataFrame))
+    denominator_is_pandas = isinstance(denominator, (pd.Series, pd.DataFrame))
+
+    if not numerator_is_pandas and not denominator_is_pandas:
+        return _masked_divide(np.asarray(numerator), np.asarray(denominator))
+
+    if not numerator_is_pandas:
+        numerator = _like(denominator, numerator)
+    elif not denominator_is_pandas:
+        denominator = _like(numerator, denominator)
+    elif type(numerator) is not type(denominator):
+        # Mixed Series and DataFrame keep pandas' own broadcasting rules
+        return numerator / denominator.mask(denominator == 0)
+    elif not all(left.equals(right) for left, right in zip(numerator.axes, denominator.axes)):
+        numerator, denominator = numerator.align(denominator)
+
+    if not all(_is_numpy_numeric(dtype) for dtype in (*_dtypes(numerator), *_dtypes(denominator))):
+        # Extension dtypes keep pandas' own NA handling
+        return numerator / denominator.mask(denominator == 0)
+
+    quotient = _masked_divide(numerator.to_numpy(), denominator.to_numpy())
+
+    if isinstance(numerator, pd.DataFrame):
+        return pd.DataFrame(quotient, index=numerator.index, columns=numerator.columns)
+
+    name = numerator.name if numerator.name == denominator.name else None
+    return pd.Series(quotient, index=numerator.index, name=name)
+
+
+def _like(template: pd.Series | pd.DataFrame, values) -> pd.Series | pd.DataFrame:
+    """Wrap array-like values in a Series or DataFrame with the axes of the template."""
+    if isinstance(template, pd.DataFrame):
+        return pd.DataFrame(values, index=template.index, columns=template.columns)
+    return pd.Series(values, index=template.index)
+
+
+def _dtypes(data: pd.Series | pd.DataFrame) -> list:
+    """The dtypes of a Series or of every column of a DataFrame."""
+    return list(data.dtypes) if isinstance(data, pd.DataFrame) else [data.dtype]
+
+
+def safe_divide_by(denominator: np.ndarray):
+    """
+    Return a function dividing arrays by the denominator, checking it for zeros only once.
+
+    Use this instead of repeated safe_divide calls when several numerators share one
+    denominator. Like safe_divide, the quotient is NaN wherever the denominator is zero.
+
+    Args:
+        denominator (np.ndarray): Values to divide by.
+
+    Returns:
+        function: Takes a numerator array and returns the quotient array.
+    """
+    valid = denominator != 0
+
+    def divide(numerator: np.ndarray) -> np.ndarray:
+        return _masked_divide(numerator, denominator, where=valid)
+
+    return divide
+
+
+def _masked_divide(
+    numerator: np.ndarray,
+    denominator: np.ndarray,
+    where: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Divide two arrays, leaving NaN wherever the denominator is zero.
+
+    A precomputed ``where`` mask of the nonzero denominators can be passed in to skip
+    the zero check.
+    """
+    if where is None:
+        where = denominator != 0
+
+    dtype = np.result_type(numerator, denominator)
+    if dtype.kind != "f":
+        dtype = np.dtype(np.float64)
+
+    quotient = np.full(np.broadcast_shapes(numerator.shape, denominator.shape), np.nan, dtype=dtype)
+    # Overflows and inf / inf silently give inf and NaN, like pandas
+    with np.errstate(over="ignore", invalid="ignore"):
+        np.divide(numerator, denominator, out=quotient, where=where)
+
+    return quotient
+
+
+def _is_numpy_numeric(dtype) -> bool:
+    """Whether a dtype is a plain NumPy integer or float dtype."""
+    return isinstance(dtype, np.dtype) and dtype.kind in "iuf"
+
+
+def aligned_values(*series: pd.Series) -> tuple[pd.Index, list[np.ndarray]]:
+    """
+    Align several Series on their index and return their underlying arrays.
+
+    The index is the union of the input indexes, as with chained pandas arithmetic,
+    and inputs are only reindexed when their index differs from it. Plain numeric
+    arrays keep their dtype; extension dtypes are converted to float64 with NaN.
+
+    Args:
+        *series (pd.Series): Time series to align.
+
+    Returns:
+        tuple[pd.Index, list[np.ndarray]]: The common index and one array per input.
+    """
+    index = series[0].index
+    for other in series[1:]:
+        if not other.index.equals(index):
+            index = index.union(other.index)
+
+    values = []
+    for item in series:
+        if not item.index.equals(index):
+            item = item.reindex(index)
+        if _is_numpy_numeric(item.dtype):
+            values.append(item.to_numpy())
+        else:
+            values.append(item.to_numpy(dtype=np.float64, na_value=np.nan))
+
+    return index, values
+
+
+def calculate_rolling_count(condition: pd.Series, window: int = 20) -> pd.Series:
+    """
+    Count the number of True values over a trailing window.
+
+    Equivalent to ``condition.rolling(window, min_periods=1).sum()`` but computed
+    with a single cumulative sum over the underlying boolean array.
+
+    Args:
+        condition (pd.Series): Boolean time series to count.
+        window (int): Number of trailing periods to count over. Defaults to 20.
+
+    Returns:
+        pd.Series: Number of True values in each trailing window.
+    """
+    # Missing values (pd.NA from nullable dtypes) count as False, as with fillna(False)
+    counts = np.cumsum(condition.to_numpy(dtype=bool, na_value=False), dtype=np.int64)
+
+    # Series no longer than the window are just the running total
+    if len(counts) > window:
+        counts[window:] = counts[window:] - counts[:-window]
+
+    return pd.Series(counts.astype(np.float64), index=condition.index, name=condition.name)
+
 def get_consecutive_number_of_growth(dataset: pd.Series, period: int = 20) -> pd.Series:
-    dataset = dataset.sort_index()  # Ensure time series is sorted
-    growth = calculate_growth(dataset, lag=1)
+    """
+    Calculate the longest streak of consecutive positive growth in the `period`
+    periods preceding each period.
 
-    results = pd.Series(index=dataset.index, dtype=int)
+    Args:
+        dataset (pd.Series): Time series data.
+        period (int): Number of preceding periods to look back over. Defaults to 20.
 
-    for i in range(len(dataset)):
-        start = max(0, i - period)
-        # Lookback last `period` quarters
-        growth_window = growth.iloc[start:i]
+    Returns:
+        pd.Series: Longest growth streak per period, NaN for the first period.
+    """
+    dataset = dataset.sort_index()  # Ensure time series is sorted
+    growth = calculate_growth(dataset, lag=1)
 
-        # If no data yet (e.g., first element), skip
-        if growth_window.empty:
-            continue
-        # Create boolean Series for positive growth
-        growth_streak = growth_window > 0
+    is_growth = (growth > 0).to_numpy(dtype=bool, na_value=False)
+    positions = np.arange(len(is_growth))
 
-        max_consecutive_growth = 0
-        current_streak = 0
+    # Length of the growth streak ending at each period, 0 when there was no growth
+    last_break = np.maximum.accumulate(np.where(is_growth, -1, positions))
+    streak = positions - last_break
 
-        for is_growth in growth_streak:
-            if is_growth:
-                current_streak += 1
-                max_consecutive_growth = max(max_consecutive_growth, current_streak)
-            else:
-                current_streak = 0
+    # A streak can only count from the start of the lookback window
+    window_start = np.maximum(positions - period, 0)
+    longest = np.full(len(is_growth), np.nan)
+    longest[1:] = 0
 
-        # Store max streak for the quarter we are evaluating
-        results.iloc[i] = max_consecutive_growth
+    for offset in range(1, period + 1):
+        current = positions[offset:]
+        previous = current - offset
+        clipped_streak = np.minimum(streak[previous], previous - window_start[current] + 1)
+        longest[current] = np.maximum(longest[current], clipped_streak)
 
-    return results
+    return pd.Series(longest, index=dataset.index)
 
 
 
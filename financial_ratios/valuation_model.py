@@ -127,7 +127,8 @@ def get_fair_value_vs_market_price(
     avg_rore = rore.rolling(window=5, min_periods=1).mean()
     
     safe_eps = eps.replace(0, np.nan)
-    eps_growth = (eps - eps.shift(1)) / abs(safe_eps.shift(1))
+    previous_eps = safe_eps.shift(1)
+    eps_growth = (eps - previous_eps) / abs(previous_eps)
     
     pe_ratio = current_price / safe_eps
     # Use 3-year average for historical comparison , 12 Quarters